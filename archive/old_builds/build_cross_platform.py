@@ -4,19 +4,21 @@ BootForge Cross-Platform Build Script
 Builds executables for Linux, Windows, and macOS
 """
 
+import gzip
+import io
 import os
 import subprocess
 import sys
 import tarfile
-import tempfile
-import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def run_command(cmd, description):
-    """Run a command with error handling"""
+    """Run a command (argv list, no shell) with error handling"""
     print(f"🔨 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(cmd, shell=False, capture_output=True, text=True)
         if result.returncode != 0:
             print(f"❌ Error: {result.stderr}")
             return False
@@ -28,15 +30,17 @@ def run_command(cmd, description):
 
 def build_linux():
     """Build Linux executable"""
-    cmd = """pyinstaller --onefile --name=BootForge-Linux-x64 \
-        --add-data="src:src" \
-        --hidden-import=PyQt6.QtWidgets \
-        --hidden-import=PyQt6.QtCore \
-        --hidden-import=PyQt6.QtGui \
-        --hidden-import=src.gui.main_window \
-        --hidden-import=src.core.config \
-        --hidden-import=src.core.logger \
-        --clean main.py"""
+    cmd = [
+        "pyinstaller", "--onefile", "--name=BootForge-Linux-x64",
+        "--add-data=src:src",
+        "--hidden-import=PyQt6.QtWidgets",
+        "--hidden-import=PyQt6.QtCore",
+        "--hidden-import=PyQt6.QtGui",
+        "--hidden-import=src.gui.main_window",
+        "--hidden-import=src.core.config",
+        "--hidden-import=src.core.logger",
+        "--clean", "main.py",
+    ]
     
     return run_command(cmd, "Building Linux executable")
 
@@ -95,8 +99,7 @@ exe = EXE(
 )
 '''
     
-    with open('BootForge-Windows.spec', 'w') as f:
-        f.write(spec_content)
+    Path('BootForge-Windows.spec').write_bytes(spec_content.encode('utf-8'))
     print("✅ Windows build spec created")
     return True
 
@@ -162,8 +165,7 @@ app = BUNDLE(
 )
 '''
     
-    with open('BootForge-macOS.spec', 'w') as f:
-        f.write(spec_content)
+    Path('BootForge-macOS.spec').write_bytes(spec_content.encode('utf-8'))
     print("✅ macOS build spec created")
     return True
 
@@ -239,8 +241,8 @@ else
 fi
 '''
     
-    with open('usb-installer.sh', 'w') as f:
-        f.write(usb_content)
+    # LF endings are mandatory for the shell script, whatever the host OS
+    Path('usb-installer.sh').write_bytes(usb_content.encode('utf-8'))
     
     # Create Windows installer
     windows_installer = '''@echo off
@@ -278,8 +280,7 @@ if exist "BootForge-Windows-x64.exe" (
 )
 '''
     
-    with open('usb-installer.bat', 'w') as f:
-        f.write(windows_installer)
+    Path('usb-installer.bat').write_bytes(windows_installer.encode('utf-8').replace(b'\n', b'\r\n'))
     
     print("✅ USB installer scripts created")
     return True
@@ -288,13 +289,8 @@ def create_usb_package():
     """Create complete USB distribution package"""
     print("📦 Creating USB distribution package...")
     
-    # Create temporary directory for packaging
-    with tempfile.TemporaryDirectory() as temp_dir:
-        package_dir = Path(temp_dir) / "BootForge-USB-Package"
-        package_dir.mkdir()
-        
-        # Create README for USB package
-        readme_content = """# BootForge USB Distribution Package
+    # Create README for USB package
+    readme_content = """# BootForge USB Distribution Package
 
 ## Installation Instructions
 
@@ -342,33 +338,43 @@ After installation:
 
 For more information, visit: https://bootforge.dev
 """
+    
+    # Stream every member straight into the gzip'd tar: no staging copy.
+    # Level 6 with 1 MiB tar blocks keeps gzip from dominating packaging time.
+    package_path = Path('dist') / 'BootForge-USB-Package.tar.gz'
+    with gzip.GzipFile(package_path, 'wb', compresslevel=6) as gz, \
+            tarfile.open(fileobj=gz, mode='w|', bufsize=1024 * 1024) as tar:
+        readme_bytes = readme_content.encode('utf-8')
+        info = tarfile.TarInfo(name='BootForge-USB-Package/README.md')
+        info.size = len(readme_bytes)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        tar.addfile(info, io.BytesIO(readme_bytes))
         
-        readme_path = package_dir / "README.md"
-        with open(readme_path, 'w') as f:
-            f.write(readme_content)
-        
-        # Copy installer scripts
-        shutil.copy2('usb-installer.sh', package_dir)
-        shutil.copy2('usb-installer.bat', package_dir)
+        # Installer scripts
+        tar.add('usb-installer.sh', arcname='BootForge-USB-Package/usb-installer.sh')
+        tar.add('usb-installer.bat', arcname='BootForge-USB-Package/usb-installer.bat')
         
-        # Copy Linux executable if it exists
+        # Linux executable if it exists
         linux_exe = Path('dist') / 'BootForge-Linux-x64'
         if linux_exe.exists():
-            shutil.copy2(linux_exe, package_dir)
+            tar.add(linux_exe, arcname='BootForge-USB-Package/BootForge-Linux-x64')
             print("✅ Included Linux executable")
         else:
             print("⚠️ Linux executable not found - package will contain installers only")
-        
-        # Create tar.gz package
-        package_path = Path('dist') / 'BootForge-USB-Package.tar.gz'
-        with tarfile.open(package_path, 'w:gz') as tar:
-            tar.add(package_dir, arcname='BootForge-USB-Package')
-        
-        # Calculate package size
-        package_size = package_path.stat().st_size / 1024 / 1024
-        print(f"✅ USB package created: {package_path} ({package_size:.1f} MB)")
-        
-        return True
+    
+    # Calculate package size
+    package_size = package_path.stat().st_size / 1024 / 1024
+    print(f"✅ USB package created: {package_path} ({package_size:.1f} MB)")
+    
+    return True
+
+def _stat_or_none(path):
+    """Single stat() for existence + size; None if the file is missing"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
 
 def main():
     """Main build process"""
@@ -384,16 +390,13 @@ def main():
         print("❌ Linux build failed")
         return False
     
-    # Prepare cross-platform specs
+    # Prepare cross-platform specs and USB installers; these are independent
+    # file writes, so run them concurrently
     print("\n🪟 Preparing Windows build configuration...")
-    prepare_windows_build()
-    
-    print("\n🍎 Preparing macOS build configuration...")  
-    prepare_macos_build()
-    
-    # Create USB installers
-    print("\n💾 Creating USB installer scripts...")
-    create_usb_installer()
+    print("🍎 Preparing macOS build configuration...")
+    print("💾 Creating USB installer scripts...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda step: step(), [prepare_windows_build, prepare_macos_build, create_usb_installer]))
     
     # Create USB distribution package
     print("\n📦 Creating USB distribution package...")
@@ -405,10 +408,12 @@ def main():
     print(f"📁 Files created in: {os.path.abspath('dist')}")
     
     # Show created files
-    if os.path.exists('dist/BootForge-Linux-x64'):
-        print(f"📦 Linux executable: dist/BootForge-Linux-x64 ({os.path.getsize('dist/BootForge-Linux-x64') / 1024 / 1024:.1f} MB)")
-    if os.path.exists('dist/BootForge-USB-Package.tar.gz'):
-        print(f"💾 USB package: dist/BootForge-USB-Package.tar.gz ({os.path.getsize('dist/BootForge-USB-Package.tar.gz') / 1024 / 1024:.1f} MB)")
+    st = _stat_or_none('dist/BootForge-Linux-x64')
+    if st:
+        print(f"📦 Linux executable: dist/BootForge-Linux-x64 ({st.st_size / 1024 / 1024:.1f} MB)")
+    st = _stat_or_none('dist/BootForge-USB-Package.tar.gz')
+    if st:
+        print(f"💾 USB package: dist/BootForge-USB-Package.tar.gz ({st.st_size / 1024 / 1024:.1f} MB)")
     
     print(f"\n📋 Next steps:")
     print(f"   • Linux: Ready for distribution and download")
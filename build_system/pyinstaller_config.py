@@ -3,67 +3,365 @@
 BootForge Build System – PyInstaller configuration
 - Generates platform-specific .spec files from templates
 - Includes folders via Tree(...)
-- Conditional UPX, icon guards, persistent logs
+- UPX via BOOTFORGE_UPX=off|fast|best (default off), icon guards, persistent logs
 - Optional Qt plugin bundling (set BOOTFORGE_ADD_QT_PLUGINS=1)
 - Windows EXE version metadata (Properties -> Version tab)
+- Optional concurrent multi-platform builds (-j/--jobs), each into dist/<platform>
+- Incremental builds: PyInstaller's work tree is only purged when inputs change
+- Bytecode optimization level via BOOTFORGE_OPTIMIZE (default 1; 2 also strips docstrings)
+- Dev builds skip the PYZ archive (noarchive); set BOOTFORGE_RELEASE=1 for release layout
+- Optional dependency wheelhouse keyed on requirements.txt (BOOTFORGE_CACHE_ENV=1, for CI)
 """
 from __future__ import annotations
 
+import argparse
+import compileall
+import fnmatch
+import hashlib
 import os
+import pkgutil
 import sys
 import shutil
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from string import Template
 from textwrap import dedent
 
 
+def ensure_cached_env(root_dir: Path) -> dict[str, str]:
+    """Return a subprocess env, with a requirements-keyed wheelhouse on PYTHONPATH when enabled.
+
+    With BOOTFORGE_CACHE_ENV=1 the dependencies are pip-installed once into
+    ``.wheelhouse-<sha256(requirements.txt)[:12]>`` (downloads cached in ``.pip-cache``),
+    so later builds with unchanged requirements skip resolving and downloading.
+    The install goes to a private temp directory that is renamed into place with
+    its ``.ok`` marker, so a concurrent or interrupted run never sees a partial wheelhouse.
+    """
+    env = dict(os.environ)
+    requirements = root_dir / "requirements.txt"
+    if os.environ.get("BOOTFORGE_CACHE_ENV", "0") != "1" or not requirements.exists():
+        return env
+
+    digest = hashlib.sha256(requirements.read_bytes()).hexdigest()[:12]
+    wheelhouse = root_dir / f".wheelhouse-{digest}"
+    marker = wheelhouse / ".ok"
+    if not marker.exists():
+        print(f"Populating dependency cache {wheelhouse.name}...")
+        staging = wheelhouse.with_name(f"{wheelhouse.name}.tmp-{os.getpid()}")
+        shutil.rmtree(staging, ignore_errors=True)
+        try:
+            subprocess.run(
+                [
+                    sys.executable, "-m", "pip", "install",
+                    "--cache-dir", str(root_dir / ".pip-cache"),
+                    "--target", str(staging),
+                    "-r", str(requirements),
+                ],
+                check=True,
+            )
+            (staging / ".ok").touch()
+            # A wheelhouse without its marker is a leftover from an older, non-atomic run
+            if wheelhouse.exists() and not marker.exists():
+                shutil.rmtree(wheelhouse)
+            try:
+                os.replace(staging, wheelhouse)
+            except OSError:
+                # Another build finished first; keep its (complete) wheelhouse
+                if not marker.exists():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(wheelhouse), env.get("PYTHONPATH")]))
+    return env
+
+
 class BootForgeBuildSystem:
     """Create Windows/macOS/Linux artifacts via PyInstaller with safe defaults."""
 
+    # (source, destination) data folders bundled when present
+    DATA_DIRS = (
+        ("src/core/data", "src/core/data"),
+        ("src/gui/icons", "src/gui/icons"),
+        ("src/core/patches", "src/core/patches"),
+        ("config", "config"),
+    )
+
+    # Keep bytecode caches, VCS metadata and tests out of Analysis (and the fingerprint)
+    DATA_EXCLUDES = ("*.pyc", "*.pyo", "__pycache__", ".git", "tests")
+
+    # Qt modules the app never imports (it uses QtCore/QtGui/QtWidgets/QtSvg only)
+    QT_EXCLUDES = (
+        "PyQt6.QtSql", "PyQt6.QtNetwork", "PyQt6.QtQml", "PyQt6.QtQuick",
+        "PyQt6.QtMultimedia", "PyQt6.QtBluetooth", "PyQt6.QtSerialPort",
+        "PyQt6.QtCharts", "PyQt6.QtDesigner", "PyQt6.QtTest", "PyQt6.Qt3DCore",
+        "PyQt6.QtWebEngineCore", "PyQt6.QtWebEngineWidgets",
+    )
+
+    # UPX breaks the CRT, the Python runtime and Qt libraries on Windows
+    UPX_EXCLUDE = ("vcruntime140.dll", "python3*.dll", "Qt6*.dll")
+
+    # Package roots whose submodules are all declared as hidden imports
+    HIDDEN_IMPORT_ROOTS = ("src",)
+
     def __init__(self) -> None:
         self.root_dir = Path(__file__).parent.parent.resolve()
         self.build_dir = self.root_dir / "dist"
         self.spec_dir = self.root_dir / "build_system" / "specs"
         self.build_dir.mkdir(parents=True, exist_ok=True)
         self.spec_dir.mkdir(parents=True, exist_ok=True)
+        # WHY: level 2 strips docstrings, which blanks click's --help text; opt in explicitly.
+        self.optimize = int(os.environ.get("BOOTFORGE_OPTIMIZE", "1"))
+        # Release builds pack bytecode into the PYZ; dev builds keep loose .pyc files
+        self.release = os.environ.get("BOOTFORGE_RELEASE", "0") == "1"
+        self._env: dict[str, str] | None = None
+        self._base_spec: Path | None = None
+        # WHY: Some environments still miss Qt plugins despite hooks; opt-in to keep size lean by default.
+        # Resolved here so the spec embeds a literal path instead of probing at every eval.
+        self._qt_plugin_dir: str | None = None
+        if os.environ.get("BOOTFORGE_ADD_QT_PLUGINS", "0") == "1":
+            self._qt_plugin_dir = self._find_qt_plugin_dir()
+            if self._qt_plugin_dir is None:
+                print("BOOTFORGE_ADD_QT_PLUGINS=1 but no PyQt6 plugin directory was found.")
+        # One existence check per data folder, shared by every spec generator
+        self._existing_data_dirs = [
+            (str(self.root_dir / src_path), dest_path)
+            for src_path, dest_path in self.DATA_DIRS
+            if (self.root_dir / src_path).exists()
+        ]
 
     # -----------------------------
     # Spec generators
     # -----------------------------
 
+    @staticmethod
+    def _find_qt_plugin_dir() -> str | None:
+        """Locate the PyQt6 plugin root, or None when it can't be found."""
+        try:
+            import PyQt6 as _pyqt6
+            qbase = Path(_pyqt6.__file__).resolve().parent
+            candidates = [qbase / "Qt6" / "plugins", qbase / "Qt" / "plugins"]
+        except Exception:
+            candidates = []
+        # Fallbacks using base_prefix
+        candidates += [
+            Path(sys.base_prefix) / "Lib" / "site-packages" / "PyQt6" / "Qt6" / "plugins",
+            Path(sys.base_prefix) / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}"
+            / "site-packages" / "PyQt6" / "Qt6" / "plugins",
+        ]
+        for candidate in candidates:
+            if candidate.exists():
+                return str(candidate)
+        return None
+
     def _qt_plugins_snippet(self) -> str:
         """Optional: bundle Qt plugin trees when env flag set (avoids runtime plugin errors)."""
-        # WHY: Some environments still miss Qt plugins despite hooks; opt-in to keep size lean by default.
-        return dedent(
+        if self._qt_plugin_dir is None:
+            return ""
+        return f"added_files += Tree({self._qt_plugin_dir!r}, prefix='qt_plugins')"
+
+    # Shared Analysis/PYZ setup, written once as bootforge_base.spec
+    BASE_SPEC_TEMPLATE = Template(
+        dedent(
             """
-            include_qt_plugins = os.environ.get('BOOTFORGE_ADD_QT_PLUGINS','0') == '1'
-            if include_qt_plugins:
-                try:
-                    import sys as _sys
-                    # Try to infer plugin root from PyQt6 install
-                    try:
-                        import PyQt6 as _pyqt6
-                        _qbase = Path(_pyqt6.__file__).resolve().parent
-                        _cands = [
-                            _qbase / 'Qt6' / 'plugins',
-                            _qbase / 'Qt' / 'plugins',
-                        ]
-                    except Exception:
-                        _cands = []
-                    # Fallbacks using base_prefix
-                    _cands += [
-                        Path(_sys.base_prefix) / 'Lib' / 'site-packages' / 'PyQt6' / 'Qt6' / 'plugins',
-                        Path(_sys.base_prefix) / 'lib' / f'python{_sys.version_info.major}.{_sys.version_info.minor}' / 'site-packages' / 'PyQt6' / 'Qt6' / 'plugins',
-                    ]
-                    for _cand in _cands:
-                        if _cand.exists():
-                            added_files += Tree(str(_cand), prefix='qt_plugins')
-                            break
-                except Exception:
-                    pass
+            # -*- mode: python ; coding: utf-8 -*-
+            # Shared by every bootforge_<platform>.spec; exec'd at spec eval time.
+            import os
+            from pathlib import Path
+            import shutil
+            from PyInstaller.building.datastruct import Tree
+            # Analysis/PYZ/EXE/BUNDLE are provided by PyInstaller at spec eval time.
+
+            block_cipher = None
+            root_dir = Path(r"$root_dir")
+            optimize = $optimize
+
+            added_files = []
+            # (absolute source, destination) pairs, existence resolved at spec generation
+            data_dirs = $data_dirs
+            data_excludes = $data_excludes
+            for full_path, dest_path in data_dirs:
+                added_files += Tree(full_path, prefix=dest_path, excludes=data_excludes)
+
+            $qt_plugins
+
+            hiddenimports = [
+                'PyQt6.QtCore','PyQt6.QtWidgets','PyQt6.QtGui',
+                'requests','psutil','cryptography','yaml','click','colorama',
+            ] + $hiddenimports
+
+            a = Analysis(
+                [str(root_dir / 'main.py')],
+                pathex=[str(root_dir)],
+                binaries=[],
+                datas=added_files,
+                hiddenimports=hiddenimports,
+                hookspath=[],
+                hooksconfig={},
+                runtime_hooks=[],
+                excludes=['matplotlib','numpy','pandas','scipy'] + $qt_excludes,
+                cipher=block_cipher,
+                noarchive=$noarchive,
+                optimize=optimize,
+            )
+            pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+            # off: no UPX (fast dev builds); fast: PyInstaller's UPX pass;
+            # best: skipped here, the driver runs upx --best --lzma afterwards
+            upx_mode = os.environ.get('BOOTFORGE_UPX', 'off')
+            use_upx = upx_mode == 'fast' and shutil.which('upx') is not None
             """
         )
+    )
+
+    # Per-platform spec: loads the base spec, then adds EXE (and BUNDLE) on top.
+    SPEC_TEMPLATE = Template(
+        dedent(
+            """
+            # -*- mode: python ; coding: utf-8 -*-
+            base_spec = r"$base_spec"
+            with open(base_spec, encoding='utf-8') as _base:
+                exec(compile(_base.read(), base_spec, 'exec'))
+            $icon_block
+
+            exe = EXE(
+                pyz,
+                a.scripts,
+                a.binaries,
+                a.zipfiles,
+                a.datas,
+                [('O', None, 'OPTION')] * optimize,
+                name='BootForge',
+                debug=False,
+                bootloader_ignore_signals=False,
+                strip=False,
+                upx=use_upx,
+                upx_exclude=$upx_exclude,
+                runtime_tmpdir=None,
+                console=False,
+                disable_windowed_traceback=False,
+                argv_emulation=False,
+                target_arch=None,
+                codesign_identity=None,
+                entitlements_file=None,$exe_extra
+            )
+            $bundle_block"""
+        )
+    )
+
+    # Per-platform fragments substituted into SPEC_TEMPLATE
+    WINDOWS_FRAGMENTS = {
+        "icon_block": (
+            "win_icon = root_dir / 'src/gui/icons/bootforge.ico'"
+            "\nicon_arg = str(win_icon) if win_icon.exists() else None"
+        ),
+        "exe_extra": "\n    icon=icon_arg,\n    version_file=str(Path(r\"{version_file}\"))",
+        "bundle_block": "",
+    }
+    MACOS_FRAGMENTS = {
+        "icon_block": (
+            "mac_icon = root_dir / 'src/gui/icons/bootforge.icns'"
+            "\nicon_arg = str(mac_icon) if mac_icon.exists() else None"
+        ),
+        "exe_extra": "",
+        "bundle_block": dedent(
+            """
+            app = BUNDLE(
+                exe,
+                name='BootForge.app',
+                icon=icon_arg,
+                bundle_identifier='com.bootforge.app',
+                info_plist={
+                    'CFBundleName': 'BootForge',
+                    'CFBundleDisplayName': 'BootForge',
+                    'CFBundleVersion': '1.0.0',
+                    'CFBundleShortVersionString': '1.0.0',
+                    'LSMinimumSystemVersion': '10.13.0',
+                    'NSHighResolutionCapable': 'True',
+                    'NSRequiresAquaSystemAppearance': 'False'
+                },
+            )
+            """
+        ),
+    }
+    LINUX_FRAGMENTS = {
+        "icon_block": "",
+        "exe_extra": "",
+        "bundle_block": "",
+    }
+
+    @staticmethod
+    def _write_if_changed(path: Path, content: str) -> bool:
+        """Write content unless the file already holds the same bytes; True if written.
+
+        New content is staged as ``<stem>_<sha256[:12]><suffix>`` and moved onto
+        the canonical name with ``os.replace``, so readers never see a partial file.
+        """
+        # WHY: rewriting identical specs bumps mtimes and invalidates PyInstaller's caches.
+        data = content.encode("utf-8")
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                return False
+        except FileNotFoundError:
+            pass
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        # pid suffix: concurrent platform builds may stage the same bootforge_base.spec
+        staged = path.with_name(f"{path.stem}_{digest}{path.suffix}.{os.getpid()}")
+        staged.write_bytes(data)
+        os.replace(staged, path)
+        return True
+
+    def _base_spec_path(self) -> Path:
+        return self.spec_dir / "bootforge_base.spec"
+
+    def _write_base_spec(self) -> Path:
+        """Render the shared Analysis/PYZ spec (once per instance) and write it if it changed."""
+        if self._base_spec is not None:
+            return self._base_spec
+        base_content = self.BASE_SPEC_TEMPLATE.substitute(
+            root_dir=str(self.root_dir),
+            optimize=str(self.optimize),
+            noarchive=str(not self.release),
+            hiddenimports=repr(self._discover_hidden_imports()),
+            data_dirs=repr(self._existing_data_dirs),
+            data_excludes=repr(list(self.DATA_EXCLUDES)),
+            qt_excludes=repr(list(self.QT_EXCLUDES)),
+            qt_plugins=self._qt_plugins_snippet(),
+        )
+        base_path = self._base_spec_path()
+        self._write_if_changed(base_path, base_content)
+        self._base_spec = base_path
+        return base_path
+
+    def _render_spec(self, platform: str, fragments: dict[str, str]) -> Path:
+        """Render SPEC_TEMPLATE for a platform (plus the base spec) and write if changed."""
+        base_path = self._write_base_spec()
+        spec_content = self.SPEC_TEMPLATE.substitute(
+            base_spec=str(base_path),
+            upx_exclude=repr(list(self.UPX_EXCLUDE)),
+            **fragments,
+        )
+        spec_path = self.spec_dir / f"bootforge_{platform}.spec"
+        self._write_if_changed(spec_path, spec_content)
+        return spec_path
+
+    def _discover_hidden_imports(self) -> list[str]:
+        """List every module under HIDDEN_IMPORT_ROOTS without importing any of them."""
+        # WHY: pkgutil.walk_packages imports each package; src/ pulls in Qt, so walk the tree instead.
+        names: list[str] = []
+
+        def walk(path: Path, prefix: str) -> None:
+            for info in pkgutil.iter_modules([str(path)], prefix):
+                names.append(info.name)
+                if info.ispkg:
+                    walk(path / info.name.rsplit(".", 1)[-1], info.name + ".")
+
+        for root in self.HIDDEN_IMPORT_ROOTS:
+            root_path = self.root_dir / root
+            if (root_path / "__init__.py").exists():
+                names.append(root)
+                walk(root_path, root + ".")
+        return sorted(names)
 
     def _windows_version_file(self) -> Path:
         """Emit a tiny VSVersionInfo file and return its path."""
@@ -99,303 +397,86 @@ class BootForgeBuildSystem:
             """
         )
         path = self.spec_dir / "bootforge_win_version.py"
-        path.write_text(vf, encoding="utf-8")
+        self._write_if_changed(path, vf)
         return path
 
     def create_windows_spec(self) -> Path:
         """Create PyInstaller spec for Windows (.exe)."""
         version_file_path = self._windows_version_file()
-        spec_tpl = Template(
-            dedent(
-                """
-                # -*- mode: python ; coding: utf-8 -*-
-                import os
-                from pathlib import Path
-                import shutil
-                from PyInstaller.building.datastruct import Tree
-                # Analysis/PYZ/EXE/BUNDLE are provided by PyInstaller at spec eval time.
-
-                block_cipher = None
-                root_dir = Path(r"$root_dir")
-
-                added_files = []
-                data_dirs = [
-                    ('src/core/data', 'src/core/data'),
-                    ('src/gui/icons', 'src/gui/icons'),
-                    ('src/core/patches', 'src/core/patches'),
-                    ('config', 'config'),
-                ]
-                for src_path, dest_path in data_dirs:
-                    full_path = root_dir / src_path
-                    if full_path.exists():
-                        added_files += Tree(str(full_path), prefix=dest_path)
-
-                $qt_plugins
-
-                hiddenimports = [
-                    'PyQt6.QtCore','PyQt6.QtWidgets','PyQt6.QtGui',
-                    'requests','psutil','cryptography','yaml','click','colorama',
-                    'src.core.hardware_detector',
-                    'src.core.os_image_manager.macos_provider',
-                    'src.core.os_image_manager.windows_provider',
-                    'src.core.os_image_manager.linux_provider',
-                    'src.gui.modern_theme','src.gui.stepper_wizard_widget',
-                ]
-
-                a = Analysis(
-                    [str(root_dir / 'main.py')],
-                    pathex=[str(root_dir)],
-                    binaries=[],
-                    datas=added_files,
-                    hiddenimports=hiddenimports,
-                    hookspath=[],
-                    hooksconfig={},
-                    runtime_hooks=[],
-                    excludes=['matplotlib','numpy','pandas','scipy'],
-                    win_no_prefer_redirects=False,
-                    win_private_assemblies=False,
-                    cipher=block_cipher,
-                    noarchive=False,
-                )
-                pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-                use_upx = shutil.which('upx') is not None
-                win_icon = root_dir / 'src/gui/icons/bootforge.ico'
-                icon_arg = str(win_icon) if win_icon.exists() else None
-
-                exe = EXE(
-                    pyz,
-                    a.scripts,
-                    a.binaries,
-                    a.zipfiles,
-                    a.datas,
-                    [],
-                    name='BootForge',
-                    debug=False,
-                    bootloader_ignore_signals=False,
-                    strip=False,
-                    upx=use_upx,
-                    upx_exclude=[],
-                    runtime_tmpdir=None,
-                    console=False,
-                    disable_windowed_traceback=False,
-                    argv_emulation=False,
-                    target_arch=None,
-                    codesign_identity=None,
-                    entitlements_file=None,
-                    icon=icon_arg,
-                    version_file=str(Path(r"$version_file"))
-                )
-                """
-            )
-        )
-        spec_content = spec_tpl.substitute(
-            root_dir=self.root_dir,
-            qt_plugins=self._qt_plugins_snippet(),
-            version_file=version_file_path,
-        )
-        spec_path = self.spec_dir / "bootforge_windows.spec"
-        spec_path.write_text(spec_content, encoding="utf-8")
-        return spec_path
+        fragments = dict(self.WINDOWS_FRAGMENTS)
+        fragments["exe_extra"] = fragments["exe_extra"].format(version_file=version_file_path)
+        return self._render_spec("windows", fragments)
 
     def create_macos_spec(self) -> Path:
         """Create PyInstaller spec for macOS (.app bundle)."""
-        spec_tpl = Template(
-            dedent(
-                """
-                # -*- mode: python ; coding: utf-8 -*-
-                import os
-                from pathlib import Path
-                import shutil
-                from PyInstaller.building.datastruct import Tree
-
-                block_cipher = None
-                root_dir = Path(r"$root_dir")
-
-                added_files = []
-                data_dirs = [
-                    ('src/core/data', 'src/core/data'),
-                    ('src/gui/icons', 'src/gui/icons'),
-                    ('src/core/patches', 'src/core/patches'),
-                    ('config', 'config'),
-                ]
-                for src_path, dest_path in data_dirs:
-                    full_path = root_dir / src_path
-                    if full_path.exists():
-                        added_files += Tree(str(full_path), prefix=dest_path)
-
-                $qt_plugins
-
-                hiddenimports = [
-                    'PyQt6.QtCore','PyQt6.QtWidgets','PyQt6.QtGui',
-                    'requests','psutil','cryptography','yaml','click','colorama',
-                    'src.core.hardware_detector',
-                    'src.core.os_image_manager.macos_provider',
-                    'src.core.os_image_manager.windows_provider',
-                    'src.core.os_image_manager.linux_provider',
-                    'src.gui.modern_theme','src.gui.stepper_wizard_widget',
-                ]
-
-                a = Analysis(
-                    [str(root_dir / 'main.py')],
-                    pathex=[str(root_dir)],
-                    binaries=[],
-                    datas=added_files,
-                    hiddenimports=hiddenimports,
-                    hookspath=[],
-                    hooksconfig={},
-                    runtime_hooks=[],
-                    excludes=['matplotlib','numpy','pandas','scipy'],
-                    cipher=block_cipher,
-                    noarchive=False,
-                )
-                pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-                use_upx = shutil.which('upx') is not None
-                mac_icon = root_dir / 'src/gui/icons/bootforge.icns'
-                icon_arg = str(mac_icon) if mac_icon.exists() else None
-
-                exe = EXE(
-                    pyz,
-                    a.scripts,
-                    a.binaries,
-                    a.zipfiles,
-                    a.datas,
-                    [],
-                    name='BootForge',
-                    debug=False,
-                    bootloader_ignore_signals=False,
-                    strip=False,
-                    upx=use_upx,
-                    upx_exclude=[],
-                    runtime_tmpdir=None,
-                    console=False,
-                    disable_windowed_traceback=False,
-                    argv_emulation=False,
-                    target_arch=None,
-                    codesign_identity=None,
-                    entitlements_file=None,
-                )
-
-                app = BUNDLE(
-                    exe,
-                    name='BootForge.app',
-                    icon=icon_arg,
-                    bundle_identifier='com.bootforge.app',
-                    info_plist={
-                        'CFBundleName': 'BootForge',
-                        'CFBundleDisplayName': 'BootForge',
-                        'CFBundleVersion': '1.0.0',
-                        'CFBundleShortVersionString': '1.0.0',
-                        'LSMinimumSystemVersion': '10.13.0',
-                        'NSHighResolutionCapable': 'True',
-                        'NSRequiresAquaSystemAppearance': 'False'
-                    },
-                )
-                """
-            )
-        )
-        spec_content = spec_tpl.substitute(
-            root_dir=self.root_dir,
-            qt_plugins=self._qt_plugins_snippet(),
-        )
-        spec_path = self.spec_dir / "bootforge_macos.spec"
-        spec_path.write_text(spec_content, encoding="utf-8")
-        return spec_path
+        return self._render_spec("macos", self.MACOS_FRAGMENTS)
 
     def create_linux_spec(self) -> Path:
         """Create PyInstaller spec for Linux (ELF)."""
-        spec_tpl = Template(
-            dedent(
-                """
-                # -*- mode: python ; coding: utf-8 -*-
-                import os
-                from pathlib import Path
-                import shutil
-                from PyInstaller.building.datastruct import Tree
-
-                block_cipher = None
-                root_dir = Path(r"$root_dir")
-
-                added_files = []
-                data_dirs = [
-                    ('src/core/data', 'src/core/data'),
-                    ('src/gui/icons', 'src/gui/icons'),
-                    ('src/core/patches', 'src/core/patches'),
-                    ('config', 'config'),
-                ]
-                for src_path, dest_path in data_dirs:
-                    full_path = root_dir / src_path
-                    if full_path.exists():
-                        added_files += Tree(str(full_path), prefix=dest_path)
-
-                $qt_plugins
-
-                hiddenimports = [
-                    'PyQt6.QtCore','PyQt6.QtWidgets','PyQt6.QtGui',
-                    'requests','psutil','cryptography','yaml','click','colorama',
-                    'src.core.hardware_detector',
-                    'src.core.os_image_manager.macos_provider',
-                    'src.core.os_image_manager.windows_provider',
-                    'src.core.os_image_manager.linux_provider',
-                    'src.gui.modern_theme','src.gui.stepper_wizard_widget',
-                ]
-
-                a = Analysis(
-                    [str(root_dir / 'main.py')],
-                    pathex=[str(root_dir)],
-                    binaries=[],
-                    datas=added_files,
-                    hiddenimports=hiddenimports,
-                    hookspath=[],
-                    hooksconfig={},
-                    runtime_hooks=[],
-                    excludes=['matplotlib','numpy','pandas','scipy'],
-                    cipher=block_cipher,
-                    noarchive=False,
-                )
-                pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-                use_upx = shutil.which('upx') is not None
-
-                exe = EXE(
-                    pyz,
-                    a.scripts,
-                    a.binaries,
-                    a.zipfiles,
-                    a.datas,
-                    [],
-                    name='BootForge',
-                    debug=False,
-                    bootloader_ignore_signals=False,
-                    strip=False,
-                    upx=use_upx,
-                    upx_exclude=[],
-                    runtime_tmpdir=None,
-                    console=False,
-                    disable_windowed_traceback=False,
-                    argv_emulation=False,
-                    target_arch=None,
-                    codesign_identity=None,
-                    entitlements_file=None,
-                )
-                """
-            )
-        )
-        spec_content = spec_tpl.substitute(
-            root_dir=self.root_dir,
-            qt_plugins=self._qt_plugins_snippet(),
-        )
-        spec_path = self.spec_dir / "bootforge_linux.spec"
-        spec_path.write_text(spec_content, encoding="utf-8")
-        return spec_path
+        return self._render_spec("linux", self.LINUX_FRAGMENTS)
 
     # -----------------------------
     # Build driver
     # -----------------------------
 
-    def build_platform(self, platform: str) -> bool:
-        """Run PyInstaller for a given platform and persist logs."""
+    def _ensure_env(self) -> dict[str, str]:
+        """Environment for PyInstaller runs (see ensure_cached_env); resolved once per instance."""
+        if self._env is None:
+            self._env = ensure_cached_env(self.root_dir)
+        return self._env
+
+    def _precompile(self) -> None:
+        """Byte-compile main.py and src/ on all cores at the build's optimization level."""
+        # WHY: warm __pycache__ (opt-N tagged) so unchanged modules aren't recompiled serially.
+        main_py = self.root_dir / "main.py"
+        if main_py.exists():
+            compileall.compile_file(str(main_py), optimize=self.optimize, quiet=1)
+        compileall.compile_dir(
+            str(self.root_dir / "src"), optimize=self.optimize, workers=0, quiet=1
+        )
+
+    def _inputs_fingerprint(self, spec_path: Path) -> str:
+        """Hash the spec, the entry point mtime and the bundled data trees."""
+        h = hashlib.sha256()
+        h.update(spec_path.read_bytes())
+        base_path = self._base_spec_path()
+        if base_path.exists():
+            h.update(base_path.read_bytes())
+        main_py = self.root_dir / "main.py"
+        if main_py.exists():
+            h.update(str(main_py.stat().st_mtime_ns).encode())
+        root_prefix = len(str(self.root_dir)) + 1
+        for full_path, _dest in self._existing_data_dirs:
+            for entry in self._scan_files(full_path):
+                st = entry.stat()
+                h.update(f"{entry.path[root_prefix:]}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+        return h.hexdigest()
+
+    @classmethod
+    def _scan_files(cls, top: str):
+        """Yield file DirEntry objects under top in a stable (sorted) order."""
+        # WHY: DirEntry carries d_type (and the stat on Windows), unlike os.walk + os.stat + relpath.
+        with os.scandir(top) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if any(fnmatch.fnmatch(entry.name, pat) for pat in cls.DATA_EXCLUDES):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from cls._scan_files(entry.path)
+            else:
+                yield entry
+
+    def build_platform(
+        self, platform: str, force: bool = False, precompile: bool = True, isolated: bool = False
+    ) -> bool:
+        """Run PyInstaller for a given platform and persist logs.
+
+        PyInstaller's work tree is reused between runs and only purged when the
+        inputs fingerprint changes; ``force=True`` always does a clean build.
+        ``precompile=False`` skips the bytecode warm-up when the caller already ran it.
+        ``isolated=True`` writes to ``dist/<platform>`` and ``build/<platform>`` so
+        concurrent builds never share an output path.
+        """
         print(f"Building BootForge for {platform}...")
 
         if platform == "windows":
@@ -410,33 +491,155 @@ class BootForgeBuildSystem:
         else:
             raise ValueError(f"Unsupported platform: {platform}")
 
-        cmd = [sys.executable, "-m", "PyInstaller", "--clean", str(spec_path)]
-        result = subprocess.run(cmd, cwd=self.root_dir, capture_output=True, text=True)
-
+        # WHY: every spec names its EXE 'BootForge'; concurrent builds would race on dist/BootForge.
+        dist_dir = self.build_dir / platform if isolated else self.build_dir
+        work_dir = self.root_dir / "build" / platform if isolated else self.root_dir / "build"
+
+        if precompile:
+            self._precompile()
+        fingerprint = self._inputs_fingerprint(spec_path)
+        # Lives beside the work tree it describes, so isolated and shared builds don't mix
+        fingerprint_path = work_dir / f".fingerprint_{platform}"
+        previous = fingerprint_path.read_text().strip() if fingerprint_path.exists() else None
+
+        cmd = [
+            sys.executable, "-m", "PyInstaller", "--noconfirm",
+            "--distpath", str(dist_dir), "--workpath", str(work_dir),
+            str(spec_path),
+        ]
+        if force:
+            cmd.insert(3, "--clean")
+        elif previous != fingerprint:
+            # WHY: inputs changed, so the cached Analysis TOCs are stale.
+            shutil.rmtree(work_dir / spec_path.stem, ignore_errors=True)
+        # Match modulegraph's code-object cache to the spec's optimization level
+        env = {**self._ensure_env(), "PYTHONOPTIMIZE": str(self.optimize)}
+        # Stream output straight to the log (unbuffered) instead of holding it in memory
         log_path = self.build_dir / f"pyinstaller_{platform}.log"
-        with open(log_path, "w", encoding="utf-8") as lf:
-            lf.write(result.stdout or "")
-            lf.write("\n--- STDERR ---\n")
-            lf.write(result.stderr or "")
         print(f"PyInstaller log -> {log_path}")
+        with open(log_path, "wb", buffering=0) as lf:
+            proc = subprocess.Popen(cmd, cwd=self.root_dir, env=env, stdout=lf, stderr=subprocess.STDOUT)
+            returncode = proc.wait()
 
-        if result.returncode != 0:
+        if returncode != 0:
             print(f"Build failed for {platform}")
+            fingerprint_path.unlink(missing_ok=True)
             return False
+        fingerprint_path.parent.mkdir(parents=True, exist_ok=True)
+        fingerprint_path.write_text(fingerprint)
 
-        produced = self.build_dir / output_name
+        produced = dist_dir / output_name
         if produced.exists():
             print(f"Successfully built {platform}: {produced}")
+            self._compress_release(produced)
         else:
             print(f"Build succeeded but artifact not found at {produced}. Check the log.")
         return True
 
+    def _compress_release(self, produced: Path) -> None:
+        """With BOOTFORGE_UPX=best, squeeze the single-file executable with upx --best --lzma."""
+        if os.environ.get("BOOTFORGE_UPX", "off") != "best":
+            return
+        upx = shutil.which("upx")
+        if upx is None:
+            print("BOOTFORGE_UPX=best but upx is not on PATH; skipping compression.")
+            return
+        if not produced.is_file():
+            # WHY: UPX on .app bundles (Mach-O) breaks code signing; only touch plain executables.
+            print(f"Skipping UPX for {produced} (not a single-file executable).")
+            return
+        result = subprocess.run([upx, "--best", "--lzma", str(produced)], capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"UPX compression failed for {produced}: {result.stderr.strip()}")
+        else:
+            print(f"UPX-compressed {produced}")
+
+    def build_all(self, platforms: list[str], jobs: int | None = None, force: bool = False) -> bool:
+        """Build several platforms concurrently, one worker process per platform.
+
+        Each platform lands in its own ``dist/<platform>`` directory. PyInstaller
+        does not cross-compile, so only the host's platform yields a native artifact.
+        """
+        # WHY: each worker gets its own PYINSTALLER_CONFIG_DIR so the caches don't collide;
+        # the path is stable per platform so the bincache stays warm across runs.
+        results: dict[str, bool] = {}
+        # Precompile once here rather than once per worker over the same tree
+        self._precompile()
+        # Populate the dependency cache here too; workers racing on one pip --target would clobber it
+        env = self._ensure_env()
+        # Render specs up front so workers find them unchanged; base spec first, it's shared
+        self._write_base_spec()
+        with ThreadPoolExecutor(max_workers=len(platforms)) as spec_pool:
+            list(spec_pool.map(lambda p: getattr(self, f"create_{p}_spec")(), platforms))
+        with ProcessPoolExecutor(max_workers=jobs or len(platforms)) as pool:
+            futures = {
+                pool.submit(
+                    _build_platform_worker,
+                    platform,
+                    str(self.root_dir / "build" / ".pyi-config" / platform),
+                    env,
+                    force,
+                ): platform
+                for platform in platforms
+            }
+            for future in as_completed(futures):
+                platform = futures[future]
+                try:
+                    results[platform] = future.result()
+                except Exception as exc:
+                    print(f"Build crashed for {platform}: {exc}")
+                    results[platform] = False
+                print(f"[{platform}] {'done' if results[platform] else 'FAILED'}")
+        return all(results.values())
+
+
+def _build_platform_worker(
+    platform: str, config_dir: str, env: dict[str, str], force: bool = False
+) -> bool:
+    """Process-pool entry point: build one platform with an isolated PyInstaller cache.
+
+    ``env`` is the parent's already-resolved build environment (see ensure_cached_env).
+    """
+    os.environ["PYINSTALLER_CONFIG_DIR"] = config_dir
+    builder = BootForgeBuildSystem()
+    builder._env = {**env, "PYINSTALLER_CONFIG_DIR": config_dir}
+    return builder.build_platform(
+        platform, force=force, precompile=False, isolated=True
+    )
+
+
+def _default_platform() -> str:
+    """Map the running interpreter's ``sys.platform`` to a build target name."""
+    return {"win": "windows", "dar": "macos"}.get(sys.platform[:3], "linux")
+
 
 if __name__ == "__main__":
+    default_platform = _default_platform()
+
+    parser = argparse.ArgumentParser(description="Build BootForge with PyInstaller")
+    parser.add_argument(
+        "platforms",
+        nargs="*",
+        choices=["windows", "macos", "linux"],
+        help=f"Platforms to build (default: {default_platform})",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Build the given platforms concurrently with up to N worker processes",
+    )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Always purge PyInstaller's cache instead of reusing it when inputs are unchanged",
+    )
+    args = parser.parse_args()
+
     builder = BootForgeBuildSystem()
-    if sys.platform.startswith("win"):
-        builder.build_platform("windows")
-    elif sys.platform.startswith("darwin"):
-        builder.build_platform("macos")
+    platforms = args.platforms or [default_platform]
+    if args.jobs is not None:
+        ok = builder.build_all(platforms, jobs=args.jobs or None, force=args.clean)
     else:
-        builder.build_platform("linux")
+        ok = all([builder.build_platform(p, force=args.clean) for p in platforms])
+    sys.exit(0 if ok else 1)
@@ -7,8 +7,18 @@ import sys
 import subprocess
 from pathlib import Path
 
-def build_simple():
-    """Build BootForge executable with minimal configuration"""
+# Sibling module; importable whether this runs as a script or as build_system.simple_build
+_BUILD_SYSTEM_DIR = str(Path(__file__).resolve().parent)
+if _BUILD_SYSTEM_DIR not in sys.path:
+    sys.path.insert(0, _BUILD_SYSTEM_DIR)
+from pyinstaller_config import ensure_cached_env
+
+def build_simple(onefile=False):
+    """Build BootForge executable with minimal configuration
+
+    Defaults to a one-folder build, which starts without unpacking itself to
+    a temp directory; pass onefile=True for a single distributable file.
+    """
     root_dir = Path(__file__).parent.parent
     
     print("Building BootForge executable...")
@@ -19,7 +29,7 @@ def build_simple():
     # Simple PyInstaller command
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--onefile",
+        *(["--onefile"] if onefile else ["--onedir", "--contents-directory", "_internal"]),
         "--windowed",
         "--name", "BootForge",
         "--add-data", f"src{path_sep}src",
@@ -35,15 +45,16 @@ def build_simple():
         "main.py"
     ]
     
-    result = subprocess.run(cmd, cwd=root_dir)
+    result = subprocess.run(cmd, cwd=root_dir, env=ensure_cached_env(root_dir))
     
     if result.returncode == 0:
         print("✅ Build successful!")
-        print(f"Executable: {root_dir}/dist/BootForge")
+        exe_path = root_dir / "dist" / "BootForge" if onefile else root_dir / "dist" / "BootForge" / "BootForge"
+        print(f"Executable: {exe_path}")
         return True
     else:
         print("❌ Build failed")
         return False
 
 if __name__ == "__main__":
-    build_simple()
\ No newline at end of file
+    build_simple(onefile="--onefile" in sys.argv[1:])
\ No newline at end of file
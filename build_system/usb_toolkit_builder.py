@@ -4,16 +4,323 @@ BootForge USB Toolkit Builder
 Creates portable USB distributions with OS image management
 """
 
+import io
 import os
+import sys
 import json
 import shutil
+import struct
+import tarfile
+import hashlib
 import zipfile
+import zlib
+import threading
+from contextlib import nullcontext
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+# Optional fast JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: also publish a multi-threaded zstd tarball next to the ZIP
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+_read_buffers = threading.local()
+
+
+def _read_buffer(size=1 << 20):
+    """Per-thread read buffer, reused for every file that thread processes"""
+    buffer = getattr(_read_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _read_buffers.buffer = bytearray(size)
+    return buffer
+
+
+# Payloads that are already compressed: deflating them again burns CPU for ~0% gain
+_STORED_EXTS = frozenset({
+    '.exe', '.iso', '.zip', '.gz', '.xz', '.bz2', '.zst', '.7z',
+    '.png', '.jpg', '.jpeg', '.dmg',
+})
+
+
+# Files at least this large (or with a _STORED_EXTS extension) are streamed into the
+# zip rather than compressed in memory on the pool
+_STREAM_THRESHOLD = 4 << 20
+
+
+def _streams(path, size):
+    """True if a file is written through ZipFile.open instead of the in-memory pool"""
+    return size >= _STREAM_THRESHOLD or os.path.splitext(path)[1].lower() in _STORED_EXTS
+
+
+def _deflates(block, level, min_ratio):
+    """Probe: does deflating this block save at least (1 - min_ratio) of its size?"""
+    return len(zlib.compress(block, level)) <= len(block) * min_ratio
+
+
+def _stream_file(zipf, zinfo, path, level=1, min_ratio=0.95):
+    """Copy a file into the zip through ZipFile.open in 1 MiB blocks; return its sha256
+
+    Known-compressed extensions are stored; other files are deflated at a fast
+    level unless a probe of their first full block shows they don't shrink.
+    """
+    stored = os.path.splitext(path)[1].lower() in _STORED_EXTS
+    digest = hashlib.sha256()
+    buffer = _read_buffer()
+    with open(path, 'rb') as f, memoryview(buffer) as view:
+        n = f.readinto(buffer)
+        if not stored and n == len(buffer):
+            stored = not _deflates(view[:n], level, min_ratio)
+        zinfo.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+        # ZipFile.open(ZipInfo) ignores the archive's compresslevel; it reads the entry's
+        zinfo._compresslevel = level
+        with zipf.open(zinfo, 'w', force_zip64=True) as dst:
+            while n:
+                block = view[:n]
+                digest.update(block)
+                dst.write(block)
+                n = f.readinto(buffer)
+    return digest.hexdigest()
+
+
+def _compress_file(path, level=1, min_ratio=0.95):
+    """Compress a small file for the zip; return (compress_type, data, crc32, size, sha256)
+
+    Files are raw-deflated (no zlib header, as stored in zips) at a fast level,
+    unless a deflate probe of their first full block shows they don't shrink,
+    in which case they are stored. Large and known-compressed files go through
+    _stream_file instead, so they are never held in memory whole.
+    """
+    stored = os.path.splitext(path)[1].lower() in _STORED_EXTS
+    compressor = None if stored else zlib.compressobj(level, zlib.DEFLATED, -15)
+    digest = hashlib.sha256()
+    buffer = _read_buffer()
+    chunks = []
+    crc = 0
+    size = 0
+    with open(path, 'rb') as f, memoryview(buffer) as view:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            block = view[:n]
+            if compressor is not None and size == 0 and n == len(buffer):
+                # Sizeable file with no telling extension
+                if not _deflates(block, level, min_ratio):
+                    compressor = None
+            crc = zlib.crc32(block, crc)
+            digest.update(block)
+            size += n
+            chunks.append(compressor.compress(block) if compressor is not None else bytes(block))
+    if compressor is not None:
+        chunks.append(compressor.flush())
+        compress_type = zipfile.ZIP_DEFLATED
+    else:
+        compress_type = zipfile.ZIP_STORED
+    return compress_type, b"".join(chunks), crc, size, digest.hexdigest()
+
+
+def _sha256_file(path):
+    """SHA256 hex digest of a file"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        # Python < 3.11: the same streaming loop over the per-thread read buffer
+        digest = hashlib.sha256()
+        buffer = _read_buffer()
+        with memoryview(buffer) as view:
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                digest.update(view[:n])
+        return digest.hexdigest()
+
+
+def _map_ahead(pool, fn, items, max_bytes):
+    """Like pool.map over (arg, size) pairs, with at most ``max_bytes`` submitted and not yet consumed"""
+    # WHY: pool.map submits everything at once, so every compressed payload would sit in RAM
+    items = iter(items)
+    pending = deque()
+    in_flight = 0
+    next_item = next(items, None)
+    try:
+        while pending or next_item is not None:
+            # Always keep one call in flight, so a single item larger than the budget still runs
+            while next_item is not None and (not pending or in_flight + next_item[1] <= max_bytes):
+                arg, size = next_item
+                pending.append((pool.submit(fn, arg), size))
+                in_flight += size
+                next_item = next(items, None)
+            future, size = pending.popleft()
+            in_flight -= size
+            yield future.result()
+    finally:
+        for future, _ in pending:
+            future.cancel()
+
+
+def _iter_raw_entry(zipf, info, chunk_size=1 << 20):
+    """Yield an entry's stored (still compressed) bytes in chunks, skipping its local header"""
+    zipf.fp.seek(info.header_offset)
+    header = zipf.fp.read(zipfile.sizeFileHeader)
+    if header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    zipf.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_len + extra_len)
+    remaining = info.compress_size
+    while remaining > 0:
+        chunk = zipf.fp.read(min(chunk_size, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+        remaining -= len(chunk)
+        yield chunk
+
+
+def _clonefile(src, dst):
+    """macOS: clone a file or a whole directory tree via clonefile(2); False if unavailable"""
+    # WHY: on APFS this is a copy-on-write clone, O(1) regardless of bundle size
+    if sys.platform != "darwin":
+        return False
+    import ctypes
+    try:
+        libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+        return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    except (OSError, AttributeError):
+        return False
+
+
+def _copy_fast(src, dst):
+    """shutil.copy2 replacement that prefers kernel-side copies (clonefile, copy_file_range)"""
+    if not _clonefile(src, dst):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            try:
+                # Linux: stays in the kernel and reflinks on btrfs/XFS
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except (AttributeError, OSError):
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    # Mode, timestamps and (on Linux) xattrs, like copy2
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _copy_tree_parallel(src, dst, min_parallel_files=16):
+    """copytree equivalent that fans per-file copies out over a thread pool"""
+    # Directory skeleton first, sequentially, so workers never race on makedirs
+    dirs = [(src, dst)]
+    files = []
+    i = 0
+    while i < len(dirs):
+        src_dir, dst_dir = dirs[i]
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    dirs.append((entry.path, target))
+                else:
+                    files.append((entry.path, target))
+        i += 1
+
+    if len(files) < min_parallel_files:
+        # Thread start-up isn't worth it for a handful of files
+        for file_src, file_dst in files:
+            _copy_fast(file_src, file_dst)
+    else:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_copy_fast, file_src, file_dst) for file_src, file_dst in files]
+            for future in as_completed(futures):
+                future.result()
+
+    # Directory metadata last (deepest first), as copying files into them bumps mtimes
+    for src_dir, dst_dir in reversed(dirs):
+        shutil.copystat(src_dir, dst_dir)
+    return dst
+
+
+def _write_file(path, content, mode=0o644):
+    """Write text in one os.write, creating the file with its final permission bits"""
+    data = content.encode("utf-8")
+    if str(path).endswith(".bat"):
+        # cmd.exe expects CRLF regardless of the platform the toolkit is built on
+        data = data.replace(b"\n", b"\r\n")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), mode)
+    try:
+        if mode & 0o111 and hasattr(os, "fchmod"):
+            # WHY: the creation mode is filtered by the umask; launchers must stay executable
+            os.fchmod(fd, mode)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_files(entries):
+    """Write independent (path, content, mode) entries concurrently"""
+    with ThreadPoolExecutor(max_workers=len(entries)) as pool:
+        for future in [pool.submit(_write_file, *entry) for entry in entries]:
+            future.result()
+
+
+def _iter_files(root):
+    """Yield (path, arc_path) for every regular file under root, as plain strings"""
+    # WHY: DirEntry carries the file type from readdir, and slicing avoids Path arithmetic
+    prefix_len = len(root) + 1
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path, entry.path[prefix_len:].replace(os.sep, '/')
+
+
+def _write_precompressed(zipf, zinfo, chunks):
+    """Append an entry whose payload (an iterable of compressed or stored chunks) is written as-is
+
+    ``zinfo.compress_size`` must already hold the payload's total length.
+    """
+    # WHY: ZipFile has no public API for precompressed data; this mirrors _ZipWriteFile.close
+    with zipf._lock:
+        zipf._writecheck(zinfo)
+        zinfo.header_offset = zipf.fp.tell()
+        zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        for chunk in chunks:
+            zipf.fp.write(chunk)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf._didModify = True
+
+
 class USBToolkitBuilder:
     """Builds portable USB toolkit with BootForge executables and OS images"""
     
+    ZSTD_LEVEL = 19
+    # Bytes of small-file input allowed in the compression pool ahead of the writer
+    COMPRESS_WINDOW = 64 << 20
+    
     def __init__(self):
         self.root_dir = Path(__file__).parent.parent
         self.dist_dir = self.root_dir / "dist"
@@ -45,11 +352,12 @@ class USBToolkitBuilder:
             exe_path = self.dist_dir / exe_name
             if exe_path.exists():
                 if exe_name == "BootForge.app":
-                    # Copy app bundle
-                    shutil.copytree(exe_path, exe_dir / exe_name)
+                    # Copy app bundle (one clonefile call on macOS)
+                    if not _clonefile(exe_path, exe_dir / exe_name):
+                        _copy_tree_parallel(str(exe_path), str(exe_dir / exe_name))
                 else:
                     # Copy single executable
-                    shutil.copy2(exe_path, exe_dir)
+                    _copy_fast(exe_path, exe_dir / exe_name)
                 print(f"Copied {exe_name} to USB toolkit")
         
         return True
@@ -68,8 +376,6 @@ if exist "BootForge.exe" (
     pause
 )
 '''
-        with open(self.usb_dir / "Launch-BootForge-Windows.bat", 'w') as f:
-            f.write(windows_launcher)
         
         # macOS shell launcher
         macos_launcher = '''#!/bin/bash
@@ -82,10 +388,6 @@ else
     read -p "Press enter to continue..."
 fi
 '''
-        macos_script = self.usb_dir / "Launch-BootForge-Mac.command"
-        with open(macos_script, 'w') as f:
-            f.write(macos_launcher)
-        macos_script.chmod(0o755)  # Make executable
         
         # Linux shell launcher
         linux_launcher = '''#!/bin/bash
@@ -98,10 +400,13 @@ else
     read -p "Press enter to continue..."
 fi
 '''
-        linux_script = self.usb_dir / "Launch-BootForge-Linux.sh"
-        with open(linux_script, 'w') as f:
-            f.write(linux_launcher)
-        linux_script.chmod(0o755)  # Make executable
+        
+        # Shell launchers are created executable
+        _write_files([
+            (self.usb_dir / "Launch-BootForge-Windows.bat", windows_launcher, 0o644),
+            (self.usb_dir / "Launch-BootForge-Mac.command", macos_launcher, 0o755),
+            (self.usb_dir / "Launch-BootForge-Linux.sh", linux_launcher, 0o755),
+        ])
         
         return True
     
@@ -111,7 +416,7 @@ fi
         # USB sync configuration
         sync_config = {
             "version": "1.0.0",
-            "last_sync": datetime.now().isoformat(),
+            "last_sync": datetime.now(),
             "image_library": {
                 "macOS": [],
                 "Windows": [],
@@ -124,8 +429,12 @@ fi
             }
         }
         
-        with open(self.usb_dir / "sync" / "sync_config.json", 'w') as f:
-            json.dump(sync_config, f, indent=2)
+        # Both encoders write datetimes as ISO 8601 strings
+        config_path = self.usb_dir / "sync" / "sync_config.json"
+        if orjson is not None:
+            config_path.write_bytes(orjson.dumps(sync_config, option=orjson.OPT_INDENT_2))
+        else:
+            config_path.write_text(json.dumps(sync_config, indent=2, default=datetime.isoformat))
         
         # USB rebuild script
         rebuild_script = '''#!/usr/bin/env python3
@@ -200,25 +509,126 @@ Features:
 Visit: github.com/your-repo/bootforge
 '''
         
-        with open(self.usb_dir / "README.txt", 'w') as f:
-            f.write(readme_content)
+        _write_file(self.usb_dir / "README.txt", readme_content)
         
         return True
     
+    def _load_zip_manifest(self, zip_path, manifest_path):
+        """Previous build's {arc_path: {size, mtime_ns, sha256}}, or {} if it can't be reused"""
+        if not (zip_path.exists() and manifest_path.exists()):
+            return {}
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            with zipfile.ZipFile(zip_path) as previous_zip:
+                names = set(previous_zip.namelist())
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return {}
+        return {arc: entry for arc, entry in manifest.items() if arc in names}
+    
     def create_zip_distribution(self):
-        """Create downloadable ZIP of USB toolkit"""
+        """Create downloadable ZIP of USB toolkit
+        
+        Files unchanged since the previous build (same size and mtime, or same
+        SHA256) have their compressed bytes copied from the previous ZIP as-is.
+        """
         zip_path = self.dist_dir / "BootForge-USB-Toolkit.zip"
+        manifest_path = self.dist_dir / "BootForge-USB-Toolkit.manifest.json"
+        tmp_path = zip_path.with_name(zip_path.name + ".tmp")
+        
+        entries = sorted(_iter_files(str(self.usb_dir)), key=lambda entry: entry[1])
+        previous = self._load_zip_manifest(zip_path, manifest_path)
+        
+        manifest = {}
+        reusable = set()
+        streamed = set()
+        fresh = []
+        for file_path, arc_path in entries:
+            st = os.stat(file_path)
+            old = previous.get(arc_path)
+            if old and old["size"] == st.st_size and (
+                    old["mtime_ns"] == st.st_mtime_ns or old["sha256"] == _sha256_file(file_path)):
+                manifest[arc_path] = dict(old, mtime_ns=st.st_mtime_ns)
+                reusable.add(arc_path)
+            else:
+                manifest[arc_path] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+                if _streams(file_path, st.st_size):
+                    streamed.add(arc_path)
+                else:
+                    fresh.append((file_path, st.st_size))
         
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(self.usb_dir):
-                for file in files:
-                    file_path = Path(root) / file
-                    arc_path = file_path.relative_to(self.usb_dir)
-                    zipf.write(file_path, arc_path)
+        # Compress small new/changed files on all cores (zlib releases the GIL), then append
+        # in arc order; a 1 MiB buffer turns the many small header/data writes into few
+        # syscalls. At most COMPRESS_WINDOW bytes of payloads are in memory at a time;
+        # large and already-compressed files are streamed through ZipFile.open instead.
+        workers = os.cpu_count() or 1
+        try:
+            with open(tmp_path, 'wb', buffering=0) as raw, \
+                    io.BufferedWriter(raw, buffer_size=1 << 20) as sink, \
+                    ThreadPoolExecutor(max_workers=workers) as pool, \
+                    zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zipf, \
+                    (zipfile.ZipFile(zip_path) if reusable else nullcontext()) as previous_zip:
+                compressed = _map_ahead(pool, _compress_file, fresh, self.COMPRESS_WINDOW)
+                for file_path, arc_path in entries:
+                    zinfo = zipfile.ZipInfo.from_file(file_path, arc_path)
+                    if arc_path in streamed:
+                        manifest[arc_path]["sha256"] = _stream_file(zipf, zinfo, file_path)
+                        continue
+                    if arc_path in reusable:
+                        # Copied across in 1 MiB chunks, however large the entry
+                        old_info = previous_zip.getinfo(arc_path)
+                        zinfo.compress_type = old_info.compress_type
+                        zinfo.CRC = old_info.CRC
+                        zinfo.file_size = old_info.file_size
+                        zinfo.compress_size = old_info.compress_size
+                        _write_precompressed(zipf, zinfo, _iter_raw_entry(previous_zip, old_info))
+                    else:
+                        compress_type, data, crc, size, sha256 = next(compressed)
+                        zinfo.compress_type = compress_type
+                        zinfo.CRC = crc
+                        zinfo.file_size = size
+                        zinfo.compress_size = len(data)
+                        manifest[arc_path]["sha256"] = sha256
+                        _write_precompressed(zipf, zinfo, (data,))
+            os.replace(tmp_path, zip_path)
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
         
-        print(f"Created ZIP distribution: {zip_path}")
+        print(f"Created ZIP distribution: {zip_path} ({len(reusable)}/{len(entries)} entries reused)")
         return zip_path
     
+    def create_zst_distribution(self):
+        """Create BootForge-USB-Toolkit.tar.zst (smaller download; the ZIP stays for double-click use)"""
+        if zstandard is None:
+            print("zstandard not installed; skipping .tar.zst distribution")
+            return None
+        
+        zst_path = self.dist_dir / "BootForge-USB-Toolkit.tar.zst"
+        tmp_path = zst_path.with_name(zst_path.name + ".tmp")
+        # threads=-1: zstd splits the stream into jobs across all cores
+        cctx = zstandard.ZstdCompressor(level=self.ZSTD_LEVEL, threads=-1)
+        try:
+            with open(tmp_path, 'wb') as f, \
+                    cctx.stream_writer(f, closefd=False) as zw, \
+                    tarfile.open(fileobj=zw, mode='w|', bufsize=1 << 20) as tf:
+                tf.add(str(self.usb_dir), arcname="BootForge-USB-Toolkit")
+            os.replace(tmp_path, zst_path)
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+        
+        print(f"Created zstd distribution: {zst_path}")
+        return zst_path
+    
     def build_usb_toolkit(self):
         """Build complete USB toolkit"""
         print("Building BootForge USB Toolkit...")
@@ -229,6 +639,7 @@ Visit: github.com/your-repo/bootforge
         self.create_sync_tools()
         self.create_readme()
         zip_path = self.create_zip_distribution()
+        self.create_zst_distribution()
         
         print(f"""
 USB Toolkit built successfully!
@@ -5,7 +5,6 @@ Main application entry point
 """
 
 import sys
-import os
 import logging
 import traceback
 from pathlib import Path
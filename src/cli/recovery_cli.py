@@ -1,12 +1,54 @@
 """BootForge Recovery CLI entrypoint."""
 from __future__ import annotations
 import argparse
-from ..recovery.core import RecoveryController
 from ..core.logger import get_logger
 
 log = get_logger(__name__)
 
 
+# Recovery modules are imported per subcommand so --help and the
+# report-only commands don't load the repair machinery.
+def _controller(args):
+    from ..recovery.core import RecoveryController
+    return RecoveryController(dry_run=getattr(args, "dry_run", False), diag=getattr(args, "diag", False))
+
+
+def _do_auto(args):
+    return _controller(args).auto()
+
+
+def _do_repair(args):
+    return _controller(args).repair(os_hint=args.os)
+
+
+def _do_reinstall(args):
+    return _controller(args).reinstall(os_hint=args.os, image=args.image, preserve_data=not args.erase)
+
+
+def _do_clone(args):
+    from ..recovery.clone import cold_fuse_clone
+    rep = cold_fuse_clone(args.src, args.dst, args.dry_run)
+    print(rep)
+    return 0
+
+
+def _do_diagnose(args):
+    from ..recovery.diagnostics import full_report
+    rep = full_report()
+    print(rep)
+    return 0
+
+
+# Subcommand name -> handler(args)
+_DISPATCH = {
+    "auto": _do_auto,
+    "repair": _do_repair,
+    "reinstall": _do_reinstall,
+    "clone": _do_clone,
+    "diagnose": _do_diagnose,
+}
+
+
 def main(argv=None):
     p = argparse.ArgumentParser(prog="bootforge-recovery", description="BootForge Recovery CLI")
     sub = p.add_subparsers(dest="cmd", required=True)
@@ -35,23 +77,7 @@ def main(argv=None):
     c_diag = sub.add_parser("diagnose", help="SMART/temps/memory hints")
 
     args = p.parse_args(argv)
-    rc = RecoveryController(dry_run=getattr(args, "dry_run", False), diag=getattr(args, "diag", False))
-
-    if args.cmd == "auto":
-        return rc.auto()
-    if args.cmd == "repair":
-        return rc.repair(os_hint=args.os)
-    if args.cmd == "reinstall":
-        return rc.reinstall(os_hint=args.os, image=args.image, preserve_data=not args.erase)
-    if args.cmd == "clone":
-        rep = rc.clone(args.src, args.dst)
-        print(rep)
-        return 0
-    if args.cmd == "diagnose":
-        rep = rc.diagnose()
-        print(rep)
-        return 0
-    return 0
+    return _DISPATCH[args.cmd](args)
 
 
 if __name__ == "__main__":
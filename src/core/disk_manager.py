@@ -3,6 +3,8 @@ BootForge Disk Management System
 Handles disk operations, image writing, and USB drive management
 """
 
+import contextlib
+import io
 import os
 import time
 import logging
@@ -10,12 +12,152 @@ import hashlib
 import shutil
 import subprocess
 import platform
+import queue
+import re
+import struct
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Callable
 from dataclasses import dataclass
 from PyQt6.QtCore import QThread, pyqtSignal, QObject
 import psutil
 
+# Optional: udev database lookups for richer device names/serials on Linux
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+
+_SYSTEM = platform.system()
+
+# Linux sendfile accepts any output fd (a block device included); elsewhere it needs a socket
+_HAS_SENDFILE = hasattr(os, 'sendfile') and _SYSTEM == "Linux"
+
+# Chunks a reader may get ahead of its consumer; each pass allocates this many buffers plus two
+_QUEUE_DEPTH = 4
+
+
+# /sys/block/<dev> attributes read by DiskManager._scan_sysfs_block
+_SYSFS_ATTRS = {
+    'removable': 'removable',
+    'model': 'device/model',
+    'vendor': 'device/vendor',
+    'serial': 'device/serial',
+}
+
+
+# Whole-disk kernel name at the start of a partition name: nvme0n1p3 -> nvme0n1, mmcblk0p1 -> mmcblk0, sdb1 -> sdb
+_DEV_NAME_RE = re.compile(r'(nvme\d+n\d+|mmcblk\d+|loop\d+|[a-z]+)')
+
+
+def _device_name(device_path: str) -> str:
+    """/sys/block name of the disk holding device_path"""
+    name = os.path.basename(device_path)
+    match = _DEV_NAME_RE.match(name)
+    return match.group(1) if match else name
+
+
+def _storage_descriptor(device: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """(vendor, model, serial) of a Windows volume or disk via IOCTL_STORAGE_QUERY_PROPERTY"""
+    import ctypes
+    from ctypes import wintypes
+    
+    kernel32 = ctypes.windll.kernel32  # type: ignore
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    # No access rights are needed to query device properties; share read/write, OPEN_EXISTING
+    handle = kernel32.CreateFileW(device, 0, 0x3, None, 3, 0, None)
+    if handle is None or handle == wintypes.HANDLE(-1).value:
+        return None, None, None
+    
+    try:
+        query = (wintypes.DWORD * 3)(0, 0, 0)  # StorageDeviceProperty, PropertyStandardQuery
+        descriptor = ctypes.create_string_buffer(1024)
+        returned = wintypes.DWORD()
+        if not kernel32.DeviceIoControl(wintypes.HANDLE(handle), 0x2D1400,  # IOCTL_STORAGE_QUERY_PROPERTY
+                                        query, ctypes.sizeof(query), descriptor, len(descriptor),
+                                        ctypes.byref(returned), None):
+            return None, None, None
+        raw = descriptor.raw[:returned.value]
+    finally:
+        kernel32.CloseHandle(wintypes.HANDLE(handle))
+    
+    def field(offset: int) -> Optional[str]:
+        if not offset or offset >= len(raw):
+            return None
+        end = raw.find(b'\0', offset)
+        return raw[offset:end if end >= 0 else len(raw)].decode('ascii', 'replace').strip() or None
+    
+    # STORAGE_DEVICE_DESCRIPTOR: VendorIdOffset, ProductIdOffset, ProductRevisionOffset, SerialNumberOffset
+    if len(raw) < 28:
+        return None, None, None
+    vendor_offset, product_offset, _, serial_offset = struct.unpack_from('<4I', raw, 12)
+    return field(vendor_offset), field(product_offset), field(serial_offset)
+
+
+def _windows_volume(device_path: str) -> str:
+    """Device namespace path of a drive root: 'E:\\' -> '\\\\.\\E:'"""
+    return '\\\\.\\' + device_path.rstrip('\\')
+
+
+_UDEV_ESCAPE_RE = re.compile(rb'\\x([0-9A-Fa-f]{2})')
+
+
+def _udev_decode(value: Optional[str]) -> Optional[str]:
+    """Decode a udev *_ENC property ('Cruzer\\x20Blade\\x20\\x20') into plain, stripped text"""
+    if not value:
+        return None
+    raw = _UDEV_ESCAPE_RE.sub(lambda m: bytes((int(m.group(1), 16),)),
+                              value.encode('utf-8', 'surrogateescape'))
+    return raw.decode('utf-8', 'replace').strip() or None
+
+
+def _read_sysfs(path: str) -> Optional[str]:
+    """Stripped contents of a sysfs attribute, or ``None`` if it is missing or unreadable"""
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _iter_mount_devices():
+    """Yield the source device of every mount on Linux, straight from /proc/self/mounts"""
+    try:
+        with open('/proc/self/mounts', 'r') as f:
+            for line in f:
+                yield line.split(' ', 1)[0]
+    except OSError:
+        for partition in psutil.disk_partitions():
+            yield partition.device
+
+
+def _fadvise(fd: int, advice: str, offset: int = 0, length: int = 0):
+    """Best-effort os.posix_fadvise (whole file by default); advice is e.g. 'POSIX_FADV_DONTNEED'"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, offset, length, getattr(os, advice))
+        except OSError:
+            pass
+
+
+def _buffer_pool(count: int, size: int) -> queue.Queue:
+    """Queue of reusable bytearrays that bounds how far a producer can run ahead"""
+    pool = queue.Queue()
+    for _ in range(count):
+        pool.put(bytearray(size))
+    return pool
+
+
+def _take_buffer(pool: queue.Queue, stop: threading.Event) -> Optional[bytearray]:
+    """Wait for a free buffer; ``None`` once stop is set"""
+    while not stop.is_set():
+        try:
+            return pool.get(timeout=0.1)
+        except queue.Empty:
+            pass
+    return None
+
 
 @dataclass
 class DiskInfo:
@@ -33,9 +175,9 @@ class DiskInfo:
     write_speed_mbps: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WriteProgress:
-    """Write operation progress information"""
+    """Write operation progress information (immutable, so one instance can safely cross threads)"""
     bytes_written: int
     total_bytes: int
     percentage: float
@@ -44,6 +186,42 @@ class WriteProgress:
     current_operation: str
 
 
+def _file_digest(fileobj, name: str):
+    """hashlib.file_digest, with an equivalent readinto loop where it is missing (Python < 3.11)"""
+    file_digest = getattr(hashlib, "file_digest", None)
+    if file_digest is not None:
+        return file_digest(fileobj, name)
+    digest = hashlib.new(name)
+    buf = bytearray(2 ** 18)
+    view = memoryview(buf)
+    while True:
+        count = fileobj.readinto(buf)
+        if not count:
+            break
+        digest.update(view[:count])
+    return digest
+
+
+class _LimitedReader(io.RawIOBase):
+    """Read-only view of the first ``limit`` bytes of a binary file (for _file_digest)"""
+    
+    def __init__(self, raw, limit: int):
+        super().__init__()
+        self._raw = raw
+        self._remaining = limit
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+        with memoryview(buffer) as view:
+            count = self._raw.readinto(view[:self._remaining]) or 0
+        self._remaining -= count
+        return count
+
+
 class DiskWriter(QThread):
     """Disk writing thread with progress monitoring"""
     
@@ -58,8 +236,12 @@ class DiskWriter(QThread):
         self.source_path = ""
         self.target_device = ""
         self.verify_after_write = True
-        self.buffer_size = 1024 * 1024  # 1MB buffer
+        # "compare" checks the device against the source block by block unless the write pass
+        # recorded a digest; "sha256" always verifies by digest (hashing the source if needed)
+        self.verify_mode = "compare"
+        self.buffer_size = 8 * 1024 * 1024  # 8MB buffer
         self.is_cancelled = False
+        self._source_hash = None  # SHA-256 of the source, computed during the write pass
     
     def write_image(self, source_path: str, target_device: str, verify: bool = True):
         """Start disk writing operation"""
@@ -117,7 +299,7 @@ class DiskWriter(QThread):
                 return False
             
             # Additional platform-specific checks
-            system = platform.system()
+            system = _SYSTEM
             
             if system == "Linux":
                 # Check if it's a block device
@@ -142,16 +324,15 @@ class DiskWriter(QThread):
     def _unmount_device(self):
         """Unmount target device if mounted"""
         try:
-            system = platform.system()
+            system = _SYSTEM
             
             if system == "Linux":
-                # Find and unmount all partitions of the device
-                partitions = psutil.disk_partitions()
-                for partition in partitions:
-                    if partition.device.startswith(self.target_device):
-                        subprocess.run(['umount', partition.device], 
-                                     capture_output=True, check=False)
-                        self.logger.info(f"Unmounted {partition.device}")
+                # Find all mounted partitions of the device and unmount them in one call
+                devices = list(dict.fromkeys(device for device in _iter_mount_devices()
+                                             if device.startswith(self.target_device)))
+                if devices:
+                    subprocess.run(['umount'] + devices, capture_output=True, check=False)
+                    self.logger.info(f"Unmounted {', '.join(devices)}")
                         
             elif system == "Darwin":  # macOS
                 # Use diskutil to unmount
@@ -195,33 +376,66 @@ class DiskWriter(QThread):
     
     def _write_image_data(self, total_size: int) -> bool:
         """Write image data to target device"""
+        if _HAS_SENDFILE and not self.verify_after_write:
+            # Nothing will be verified, so the data never has to pass through Python
+            return self._sendfile_image_data(total_size)
+        
         try:
             bytes_written = 0
             start_time = time.time()
             last_progress_time = start_time
             
-            with open(self.source_path, 'rb') as source:
-                with open(self.target_device, 'wb') as target:
+            # Hash the source as it streams past so verification only has
+            # to read the device back
+            self._source_hash = hashlib.sha256()
+            
+            # Device writes run on their own thread so the next chunks are read
+            # and hashed while earlier ones are still in flight
+            stop = threading.Event()
+            errors = []
+            free = _buffer_pool(_QUEUE_DEPTH + 2, self.buffer_size)
+            target_chunks = queue.Queue()
+            writer = threading.Thread(
+                target=self._write_chunks,
+                args=(self.target_device, target_chunks, free, stop, errors),
+                daemon=True
+            )
+            writer.start()
+            
+            try:
+                with open(self.source_path, 'rb', buffering=0) as source:
+                    # Read once front to back: widen readahead, then drop the pages
+                    _fadvise(source.fileno(), 'POSIX_FADV_SEQUENTIAL')
                     while bytes_written < total_size and not self.is_cancelled:
-                        # Read chunk
-                        chunk = source.read(self.buffer_size)
-                        if not chunk:
+                        # Read chunk into a free buffer (none come back if the writer fails)
+                        buf = _take_buffer(free, stop)
+                        if buf is None:
+                            break
+                        count = source.readinto(buf)
+                        if not count:
                             break
+                        with memoryview(buf) as view:
+                            self._source_hash.update(view[:count])
                         
-                        # Write chunk
-                        target.write(chunk)
-                        target.flush()
-                        bytes_written += len(chunk)
+                        # Queue chunk
+                        target_chunks.put((buf, count))
+                        bytes_written += count
                         
                         # Update progress
                         current_time = time.time()
                         if current_time - last_progress_time >= 0.5:  # Update every 0.5 seconds
                             self._emit_progress(bytes_written, total_size, current_time - start_time)
                             last_progress_time = current_time
-                        
-                        # Sync to disk periodically
-                        if bytes_written % (self.buffer_size * 100) == 0:
-                            os.fsync(target.fileno())
+                    _fadvise(source.fileno(), 'POSIX_FADV_DONTNEED')
+            finally:
+                # Drop whatever is still queued on cancel, otherwise let the writer drain it
+                if self.is_cancelled:
+                    stop.set()
+                target_chunks.put(None)
+                writer.join()
+            
+            if errors:
+                raise errors[0]
             
             # Final sync
             if not self.is_cancelled:
@@ -234,53 +448,227 @@ class DiskWriter(QThread):
             self.logger.error(f"Error writing image data: {e}")
             return False
     
-    def _verify_written_data(self, total_size: int) -> bool:
-        """Verify written data matches source"""
+    def _write_chunks(self, path: str, chunks: queue.Queue, free: queue.Queue,
+                      stop: threading.Event, errors: list):
+        """Writer thread: write queued ``(buffer, count)`` chunks to path until a ``None`` sentinel
+        
+        Buffers go back to free once written. A write error is appended to
+        errors and sets stop so the producer gives up.
+        """
         try:
-            source_hash = hashlib.sha256()
-            target_hash = hashlib.sha256()
-            
-            bytes_verified = 0
+            with open(path, 'wb', buffering=0) as target:
+                while True:
+                    chunk = chunks.get()
+                    if chunk is None or stop.is_set():
+                        break
+                    buf, count = chunk
+                    # Unbuffered writes may be partial
+                    with memoryview(buf) as view:
+                        pending = view[:count]
+                        while pending:
+                            pending = pending[target.write(pending):]
+                    free.put(buf)
+                
+                # One barrier at the end; the kernel streams dirty pages out meanwhile.
+                # The now-clean pages are dropped so verification reads the device
+                if not stop.is_set():
+                    os.fsync(target.fileno())
+                    _fadvise(target.fileno(), 'POSIX_FADV_DONTNEED')
+        except Exception as e:
+            errors.append(e)
+            stop.set()
+    
+    def _sendfile_image_data(self, total_size: int) -> bool:
+        """Copy the image to the target in-kernel with os.sendfile (no source digest is recorded)"""
+        try:
+            bytes_written = 0
             start_time = time.time()
             last_progress_time = start_time
+            self._source_hash = None
             
             with open(self.source_path, 'rb') as source:
-                with open(self.target_device, 'rb') as target:
-                    while bytes_verified < total_size and not self.is_cancelled:
-                        source_chunk = source.read(self.buffer_size)
-                        target_chunk = target.read(self.buffer_size)
-                        
-                        if not source_chunk or not target_chunk:
+                with open(self.target_device, 'wb') as target:
+                    source_fd, target_fd = source.fileno(), target.fileno()
+                    _fadvise(source_fd, 'POSIX_FADV_SEQUENTIAL')
+                    while bytes_written < total_size and not self.is_cancelled:
+                        sent = os.sendfile(target_fd, source_fd, bytes_written,
+                                           min(self.buffer_size, total_size - bytes_written))
+                        if not sent:
                             break
+                        bytes_written += sent
                         
-                        source_hash.update(source_chunk)
-                        target_hash.update(target_chunk)
-                        bytes_verified += len(source_chunk)
-                        
-                        # Update progress
                         current_time = time.time()
                         if current_time - last_progress_time >= 0.5:
-                            progress = WriteProgress(
-                                bytes_written=bytes_verified,
-                                total_bytes=total_size,
-                                percentage=(bytes_verified / total_size) * 100,
-                                speed_mbps=0,  # Verification doesn't track speed
-                                eta_seconds=0,
-                                current_operation="Verifying data..."
-                            )
-                            self.progress_updated.emit(progress)
+                            self._emit_progress(bytes_written, total_size, current_time - start_time)
                             last_progress_time = current_time
+                    
+                    if not self.is_cancelled:
+                        os.fsync(target_fd)
+                        _fadvise(target_fd, 'POSIX_FADV_DONTNEED')
+                    _fadvise(source_fd, 'POSIX_FADV_DONTNEED')
+            
+            return not self.is_cancelled
+            
+        except Exception as e:
+            self.logger.error(f"Error writing image data: {e}")
+            return False
+    
+    def _read_chunks(self, path: str, limit: int, chunks: queue.Queue, free: queue.Queue,
+                     stop: threading.Event):
+        """Reader thread: queue the first ``limit`` bytes of path as ``(buffer, count)`` chunks
+        
+        Buffers are taken from free and must be returned by the consumer.
+        Ends with a ``None`` sentinel; a read error is queued as the exception.
+        """
+        try:
+            # Unbuffered: readinto fills the pooled buffer straight from the device
+            with open(path, 'rb', buffering=0) as f:
+                _fadvise(f.fileno(), 'POSIX_FADV_SEQUENTIAL')
+                remaining = limit
+                while remaining > 0 and not self.is_cancelled:
+                    buf = _take_buffer(free, stop)
+                    if buf is None:
+                        break
+                    with memoryview(buf) as view:
+                        count = f.readinto(view[:min(len(buf), remaining)])
+                    if not count:
+                        break
+                    # The window now lives in buf; drop its pages so the page cache stays clean
+                    _fadvise(f.fileno(), 'POSIX_FADV_DONTNEED', limit - remaining, count)
+                    remaining -= count
+                    chunks.put((buf, count))
+        except Exception as e:
+            chunks.put(e)
+        finally:
+            chunks.put(None)
+    
+    def _device_chunks(self, total_size: int):
+        """Yield ``(buffer, count)`` chunks of the first ``total_size`` bytes of the target device
+        
+        The device is read on its own thread so reads overlap whatever the
+        caller does with each chunk. A buffer is only valid until the next
+        chunk is requested.
+        """
+        stop = threading.Event()
+        free = _buffer_pool(_QUEUE_DEPTH + 2, self.buffer_size)
+        target_chunks = queue.Queue()
+        reader = threading.Thread(
+            target=self._read_chunks,
+            args=(self.target_device, total_size, target_chunks, free, stop),
+            daemon=True
+        )
+        reader.start()
+        
+        try:
+            while True:
+                target_chunk = target_chunks.get()
+                if isinstance(target_chunk, Exception):
+                    raise target_chunk
+                if not target_chunk:
+                    return
+                
+                yield target_chunk
+                free.put(target_chunk[0])
+        finally:
+            # The reader exits at its next wait for a free buffer
+            stop.set()
+            reader.join()
+    
+    def _verify_written_data(self, total_size: int) -> bool:
+        """Verify written data matches source
+        
+        The device is read back and hashed against the source digest
+        recorded by the write pass. Without one, the source is read again
+        and compared block by block (or hashed, with ``verify_mode="sha256"``).
+        """
+        try:
+            if self._source_hash is None:
+                if self.verify_mode != "sha256":
+                    return self._compare_written_data(total_size)
+                # No write pass in this session: hash the source in one C-level streaming loop
+                with open(self.source_path, 'rb', buffering=0) as source:
+                    self._source_hash = _file_digest(_LimitedReader(source, total_size), 'sha256')
+            
+            target_hash = hashlib.sha256()
+            
+            bytes_verified = 0
+            last_progress_time = time.time()
+            
+            with contextlib.closing(self._device_chunks(total_size)) as target_chunks:
+                for buf, count in target_chunks:
+                    if self.is_cancelled:
+                        break
+                    with memoryview(buf) as view:
+                        target_hash.update(view[:count])
+                    bytes_verified += count
+                    
+                    # Update progress
+                    current_time = time.time()
+                    if current_time - last_progress_time >= 0.5:
+                        self._emit_verify_progress(bytes_verified, total_size)
+                        last_progress_time = current_time
             
             if self.is_cancelled:
                 return False
             
-            # Compare hashes
-            return source_hash.hexdigest() == target_hash.hexdigest()
+            # Compare hashes (a short device read leaves bytes_verified behind)
+            return bytes_verified == total_size and target_hash.digest() == self._source_hash.digest()
             
         except Exception as e:
             self.logger.error(f"Error verifying written data: {e}")
             return False
     
+    def _compare_written_data(self, total_size: int) -> bool:
+        """Compare the device with the source block by block, stopping at the first difference"""
+        bytes_verified = 0
+        last_progress_time = time.time()
+        source_buf = bytearray(self.buffer_size)
+        
+        with open(self.source_path, 'rb', buffering=0) as source, memoryview(source_buf) as source_view:
+            with contextlib.closing(self._device_chunks(total_size)) as target_chunks:
+                for buf, count in target_chunks:
+                    if self.is_cancelled:
+                        return False
+                    
+                    # Raw reads may be short; fill the source window to the device chunk's size
+                    filled = 0
+                    while filled < count:
+                        read = source.readinto(source_view[filled:count])
+                        if not read:
+                            break
+                        filled += read
+                    
+                    # bytearray equality is a memcmp; memoryview equality compares item by item
+                    if count == len(buf) == len(source_buf):
+                        matches = buf == source_buf
+                    else:
+                        matches = buf[:count] == source_buf[:count]
+                    if filled != count or not matches:
+                        self.logger.error(f"Verification mismatch within {count} bytes of offset {bytes_verified}")
+                        return False
+                    bytes_verified += count
+                    
+                    # Update progress
+                    current_time = time.time()
+                    if current_time - last_progress_time >= 0.5:
+                        self._emit_verify_progress(bytes_verified, total_size)
+                        last_progress_time = current_time
+        
+        # A short device read leaves bytes_verified behind
+        return not self.is_cancelled and bytes_verified == total_size
+    
+    def _emit_verify_progress(self, bytes_verified: int, total_bytes: int):
+        """Emit verification progress update signal"""
+        progress = WriteProgress(
+            bytes_written=bytes_verified,
+            total_bytes=total_bytes,
+            percentage=(bytes_verified / total_bytes) * 100,
+            speed_mbps=0,  # Verification doesn't track speed
+            eta_seconds=0,
+            current_operation="Verifying data..."
+        )
+        self.progress_updated.emit(progress)
+    
     def _emit_progress(self, bytes_written: int, total_bytes: int, elapsed_time: float):
         """Emit progress update signal"""
         percentage = (bytes_written / total_bytes) * 100
@@ -307,6 +695,20 @@ class DiskManager:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.writer = DiskWriter()
+        
+        # Bind the per-device probes for this platform once
+        if _SYSTEM == "Linux":
+            self._scan_block_devices = self._scan_udev_block if pyudev else self._scan_sysfs_block
+            self._is_removable_drive = self._is_removable_linux
+            self._get_device_info = self._get_device_info_linux
+            self._get_device_serial = self._get_device_serial_linux
+        elif _SYSTEM == "Windows":
+            self._scan_block_devices = self._scan_windows_volumes
+            self._is_removable_drive = self._is_removable_windows
+            self._get_device_info = self._get_device_info_windows
+            self._get_device_serial = self._get_device_serial_windows
+        elif _SYSTEM == "Darwin":  # macOS
+            self._is_removable_drive = self._is_removable_darwin
     
     def get_removable_drives(self) -> List[DiskInfo]:
         """Get list of removable drives suitable for writing"""
@@ -314,15 +716,15 @@ class DiskManager:
         
         try:
             partitions = psutil.disk_partitions()
+            block_devices = self._scan_block_devices()
             
             for partition in partitions:
-                if self._is_removable_drive(partition.device):
+                is_removable, model, vendor, serial = self._describe_device(partition.device, block_devices)
+                if is_removable:
                     try:
                         usage = psutil.disk_usage(partition.mountpoint)
                         
                         # Get device information
-                        model, vendor = self._get_device_info(partition.device)
-                        serial = self._get_device_serial(partition.device)
                         health = self._check_device_health(partition.device)
                         write_speed = self._measure_write_speed(partition.device)
                         
@@ -362,6 +764,7 @@ class DiskManager:
             
             # Also get physical drives information (Linux/Windows specific)
             physical_drives = self._get_physical_drives()
+            block_devices = self._scan_block_devices()
             
             for partition in partitions:
                 base_device = self._get_base_device(partition.device)
@@ -373,7 +776,7 @@ class DiskManager:
                 
                 try:
                     usage = psutil.disk_usage(partition.mountpoint)
-                    is_removable = self._is_removable_drive(partition.device)
+                    is_removable, model, vendor, serial = self._describe_device(partition.device, block_devices)
                     is_system = self._is_system_drive(partition.device)
                     
                     # Skip system drives unless explicitly requested
@@ -381,8 +784,6 @@ class DiskManager:
                         continue
                     
                     # Get detailed device information
-                    model, vendor = self._get_device_info(partition.device)
-                    serial = self._get_device_serial(partition.device)
                     health = self._check_device_health(partition.device)
                     write_speed = self._measure_write_speed(partition.device)
                     
@@ -437,85 +838,151 @@ class DiskManager:
         drives.sort(key=lambda d: (not d.is_removable, d.size_bytes))
         return drives
     
+    def _scan_block_devices(self) -> Optional[Dict[str, Dict[str, Optional[str]]]]:
+        """Batch-read removable/model/vendor/serial for every device, keyed for _describe_device
+        
+        ``None`` where there is no batch scan; callers then use the per-device probes.
+        __init__ binds the platform's scan over this default.
+        """
+        return None
+    
+    def _scan_sysfs_block(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Read the _SYSFS_ATTRS of every /sys/block device in one pass"""
+        devices = {}
+        try:
+            with os.scandir('/sys/block') as entries:
+                for entry in entries:
+                    devices[entry.name] = {
+                        key: _read_sysfs(os.path.join(entry.path, attr))
+                        for key, attr in _SYSFS_ATTRS.items()
+                    }
+        except OSError as e:
+            self.logger.debug(f"Could not scan /sys/block: {e}")
+        return devices
+    
+    def _scan_udev_block(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Enumerate whole disks in one udev query, preferring udev's ID_* properties over sysfs
+        
+        USB mass storage rarely exposes device/serial in sysfs; udev has it as ID_SERIAL_SHORT.
+        Names come from the hwdb, then the decoded ID_*_ENC values, then sysfs; plain
+        ID_MODEL/ID_VENDOR are skipped as udev replaces their spaces with underscores.
+        """
+        devices = {}
+        try:
+            for device in pyudev.Context().list_devices(subsystem='block', DEVTYPE='disk'):
+                properties = device.properties
+                devices[device.sys_name] = {
+                    'removable': _read_sysfs(os.path.join(device.sys_path, 'removable')),
+                    'model': (properties.get('ID_MODEL_FROM_DATABASE')
+                              or _udev_decode(properties.get('ID_MODEL_ENC'))
+                              or _read_sysfs(os.path.join(device.sys_path, 'device/model'))),
+                    'vendor': (properties.get('ID_VENDOR_FROM_DATABASE')
+                               or _udev_decode(properties.get('ID_VENDOR_ENC'))
+                               or _read_sysfs(os.path.join(device.sys_path, 'device/vendor'))),
+                    'serial': (properties.get('ID_SERIAL_SHORT')
+                               or _read_sysfs(os.path.join(device.sys_path, 'device/serial'))),
+                }
+        except Exception as e:
+            self.logger.debug(f"udev enumeration failed, falling back to /sys/block: {e}")
+            return self._scan_sysfs_block()
+        return devices
+    
+    def _scan_windows_volumes(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Query every local drive letter once, keyed by its root path (as psutil reports it)
+        
+        Only DRIVE_REMOVABLE and DRIVE_FIXED letters are opened; network shares and
+        optical drives are skipped, as CreateFileW on a disconnected share can stall.
+        """
+        devices = {}
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32  # type: ignore
+            mask = kernel32.GetLogicalDrives()
+            for index in range(26):
+                if mask & (1 << index):
+                    root = f"{chr(ord('A') + index)}:\\"
+                    drive_type = kernel32.GetDriveTypeW(root)
+                    if drive_type not in (2, 3):  # DRIVE_REMOVABLE, DRIVE_FIXED
+                        continue
+                    vendor, model, serial = _storage_descriptor(_windows_volume(root))
+                    devices[root] = {
+                        'removable': '1' if drive_type == 2 else '0',
+                        'model': model,
+                        'vendor': vendor,
+                        'serial': serial,
+                    }
+        except (AttributeError, OSError) as e:
+            self.logger.debug(f"Could not enumerate Windows volumes: {e}")
+        return devices
+    
+    def _describe_device(self, device_path: str,
+                         block_devices: Optional[Dict[str, Dict[str, Optional[str]]]]
+                         ) -> Tuple[bool, Optional[str], Optional[str], Optional[str]]:
+        """Get (is_removable, model, vendor, serial), from a _scan_sysfs_block result when there is one"""
+        if block_devices is None:
+            model, vendor = self._get_device_info(device_path)
+            return (self._is_removable_drive(device_path), model, vendor,
+                    self._get_device_serial(device_path))
+        
+        key = _device_name(device_path) if _SYSTEM == "Linux" else device_path
+        info = block_devices.get(key, {})
+        return info.get('removable') == '1', info.get('model'), info.get('vendor'), info.get('serial')
+    
+    # Per-device probes. These defaults cover unsupported platforms; __init__
+    # binds the variant for the running platform over them.
+    
     def _is_removable_drive(self, device_path: str) -> bool:
         """Check if device is a removable drive"""
+        return False
+    
+    def _get_device_info(self, device_path: str) -> Tuple[Optional[str], Optional[str]]:
+        """Get device model and vendor information"""
+        return None, None
+    
+    def _get_device_serial(self, device_path: str) -> Optional[str]:
+        """Get device serial number"""
+        return None
+    
+    def _is_removable_linux(self, device_path: str) -> bool:
+        device_name = _device_name(device_path)
+        return _read_sysfs(f"/sys/block/{device_name}/removable") == '1'
+    
+    def _is_removable_windows(self, device_path: str) -> bool:
         try:
-            system = platform.system()
-            
-            if system == "Linux":
-                device_name = device_path.split('/')[-1].rstrip('0123456789')
-                removable_file = f"/sys/block/{device_name}/removable"
-                
-                if os.path.exists(removable_file):
-                    with open(removable_file, 'r') as f:
-                        return f.read().strip() == '1'
-                        
-            elif system == "Windows":
-                try:
-                    import ctypes
-                    # Only access windll on Windows
-                    if hasattr(ctypes, 'windll'):
-                        drive_type = ctypes.windll.kernel32.GetDriveTypeW(device_path)  # type: ignore
-                        return drive_type == 2  # DRIVE_REMOVABLE
-                    return False
-                except (AttributeError, OSError):
-                    return False
-                
-            elif system == "Darwin":  # macOS
-                return "/Volumes/" in device_path
-                
+            import ctypes
+            # Only access windll on Windows
+            if hasattr(ctypes, 'windll'):
+                drive_type = ctypes.windll.kernel32.GetDriveTypeW(device_path)  # type: ignore
+                return drive_type == 2  # DRIVE_REMOVABLE
             return False
-            
-        except Exception:
+        except (AttributeError, OSError):
             return False
     
-    def _get_device_info(self, device_path: str) -> Tuple[Optional[str], Optional[str]]:
-        """Get device model and vendor information"""
+    def _get_device_info_windows(self, device_path: str) -> Tuple[Optional[str], Optional[str]]:
         try:
-            system = platform.system()
-            
-            if system == "Linux":
-                device_name = device_path.split('/')[-1].rstrip('0123456789')
-                
-                model_file = f"/sys/block/{device_name}/device/model"
-                vendor_file = f"/sys/block/{device_name}/device/vendor"
-                
-                model = None
-                vendor = None
-                
-                if os.path.exists(model_file):
-                    with open(model_file, 'r') as f:
-                        model = f.read().strip()
-                
-                if os.path.exists(vendor_file):
-                    with open(vendor_file, 'r') as f:
-                        vendor = f.read().strip()
-                
-                return model, vendor
-                
-            return None, None
-            
-        except Exception:
+            vendor, model, _ = _storage_descriptor(_windows_volume(device_path))
+            return model, vendor
+        except (AttributeError, OSError):
             return None, None
     
-    def _get_device_serial(self, device_path: str) -> Optional[str]:
-        """Get device serial number"""
+    def _get_device_serial_windows(self, device_path: str) -> Optional[str]:
         try:
-            system = platform.system()
-            
-            if system == "Linux":
-                device_name = device_path.split('/')[-1].rstrip('0123456789')
-                serial_file = f"/sys/block/{device_name}/device/serial"
-                
-                if os.path.exists(serial_file):
-                    with open(serial_file, 'r') as f:
-                        return f.read().strip()
-                        
-            return None
-            
-        except Exception:
+            return _storage_descriptor(_windows_volume(device_path))[2]
+        except (AttributeError, OSError):
             return None
     
+    def _is_removable_darwin(self, device_path: str) -> bool:
+        return "/Volumes/" in device_path
+    
+    def _get_device_info_linux(self, device_path: str) -> Tuple[Optional[str], Optional[str]]:
+        device_name = _device_name(device_path)
+        return (_read_sysfs(f"/sys/block/{device_name}/device/model"),
+                _read_sysfs(f"/sys/block/{device_name}/device/vendor"))
+    
+    def _get_device_serial_linux(self, device_path: str) -> Optional[str]:
+        device_name = _device_name(device_path)
+        return _read_sysfs(f"/sys/block/{device_name}/device/serial")
+    
     def _check_device_health(self, device_path: str) -> str:
         """Check device health status"""
         try:
@@ -530,12 +997,11 @@ class DiskManager:
     
     def _get_base_device(self, device_path: str) -> str:
         """Get base device path (removes partition numbers)"""
-        import re
         # Remove partition numbers: /dev/sda1 -> /dev/sda, /dev/nvme0n1p1 -> /dev/nvme0n1
-        if platform.system() == "Linux":
+        if _SYSTEM == "Linux":
             # Handle nvme drives (nvme0n1p1 -> nvme0n1) and regular drives (sda1 -> sda)
             return re.sub(r'p?\d+$', '', device_path)
-        elif platform.system() == "Windows":
+        elif _SYSTEM == "Windows":
             # Handle Windows drive paths
             return device_path
         else:  # macOS
@@ -563,7 +1029,7 @@ class DiskManager:
     def _is_system_drive(self, device_path: str) -> bool:
         """Check if device contains the operating system"""
         try:
-            system = platform.system()
+            system = _SYSTEM
             
             if system == "Linux":
                 # Check if device contains root filesystem
@@ -595,7 +1061,7 @@ class DiskManager:
         drives = []
         
         try:
-            system = platform.system()
+            system = _SYSTEM
             
             if system == "Linux":
                 # Read from /proc/partitions or use lsblk
@@ -644,7 +1110,6 @@ class DiskManager:
     def _parse_size(self, size_str: str) -> int:
         """Parse size string (e.g., '500G', '1T') to bytes"""
         try:
-            import re
             match = re.match(r'(\d+\.?\d*)([KMGT]?)', size_str.upper())
             if match:
                 number, unit = match.groups()
@@ -676,7 +1141,7 @@ class DiskManager:
     def format_device(self, device_path: str, filesystem: str = "fat32") -> bool:
         """Format device with specified filesystem"""
         try:
-            system = platform.system()
+            system = _SYSTEM
             
             if system == "Linux":
                 if filesystem.lower() == "fat32":
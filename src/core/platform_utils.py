@@ -6,9 +6,12 @@ import sys
 from pathlib import Path
 import platform
 
+_IS_WIN = sys.platform.startswith("win")
+_IS_MAC = sys.platform.startswith("darwin")
+
 
 def is_admin() -> bool:
-    if sys.platform.startswith("win"):
+    if _IS_WIN:
         try:
             return bool(ctypes.windll.shell32.IsUserAnAdmin())
         except Exception:
@@ -21,9 +24,9 @@ def arch() -> str:
 
 
 def is_efi_boot() -> bool:
-    if sys.platform.startswith("win"):
+    if _IS_WIN:
         return True
-    if sys.platform.startswith("darwin"):
+    if _IS_MAC:
         return True
     return Path("/sys/firmware/efi").exists()
 
@@ -7,12 +7,19 @@ import re
 import os
 import logging
 import hashlib
+import hmac
+import shutil
+import mmap
 import requests
 import subprocess
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
+from urllib3.util.retry import Retry
 
 from src.core.os_image_manager import (
     OSImageProvider, OSImageInfo, ImageStatus, VerificationMethod
@@ -20,6 +27,41 @@ from src.core.os_image_manager import (
 from src.core.config import Config
 
 
+# Filename components used by LinuxProvider._detect_architecture
+_FILENAME_TOKEN_SPLIT = re.compile(r"[-.+]")
+_X86_64_TOKENS = frozenset({"amd64", "x86_64"})
+_ARM64_TOKENS = frozenset({"arm64", "aarch64"})
+
+
+@dataclass(frozen=True, slots=True)
+class _LTSRelease:
+    """Everything about an Ubuntu LTS release that doesn't depend on the listing"""
+    version: str
+    name: str
+    codename: str
+    support_until: str
+    release_url: str
+    checksum_url: str
+    signature_url: str
+
+
+def _build_lts_releases(releases: Dict[str, Dict], base_url: str) -> Tuple[_LTSRelease, ...]:
+    """Resolve release URLs once, at import time"""
+    lts_releases = []
+    for version, info in releases.items():
+        release_url = urljoin(base_url, f"{version}/")
+        lts_releases.append(_LTSRelease(
+            version=version,
+            name=info["name"],
+            codename=info["codename"],
+            support_until=info["support_until"],
+            release_url=release_url,
+            checksum_url=urljoin(release_url, "SHA256SUMS"),
+            signature_url=urljoin(release_url, "SHA256SUMS.gpg"),
+        ))
+    return tuple(lts_releases)
+
+
 class LinuxProvider(OSImageProvider):
     """Provider for Linux distributions, supporting Ubuntu LTS, Kali Linux, Parrot OS, and Arch Linux releases"""
     
@@ -217,6 +259,7 @@ class LinuxProvider(OSImageProvider):
     }
     
     UBUNTU_BASE_URL = "http://releases.ubuntu.com/"
+    UBUNTU_LTS = _build_lts_releases(UBUNTU_LTS_RELEASES, UBUNTU_BASE_URL)
     KALI_BASE_URL = "https://cdimage.kali.org/"
     KALI_CURRENT_URL = "https://cdimage.kali.org/current/"
     PARROT_BASE_URL = "https://download.parrot.sh/parrot/iso/"
@@ -229,6 +272,14 @@ class LinuxProvider(OSImageProvider):
     KALI_SIGNING_KEY = "44C6513A8E4FB3D30875F758ED444FF07D8D0BF6"  # Kali Linux Official Signing Key
     PARROT_SIGNING_KEY = "B71182234655E4D92DA02DF7A8286AF0E81EE4A"  # Parrot Archive Keyring (2024-2026)
     ARCH_SIGNING_KEY = "3E80CA1A8B89F69CBA57D98A76A5EF9054449A5C"  # Arch Linux Release Engineering (Pierre Schmitz)
+    UBUNTU_ISO_HREF_RE = re.compile(r'href="(ubuntu-(\d+(?:\.\d+)*)[^"]*?\.iso)"')  # (filename, full version)
+    SHA256_WINDOW = 64 * 1024 * 1024  # mmap window hashed per update(); must stay page-aligned
+    # Directory index row: link, modification time, then size ("5.9G" in Apache, bytes in nginx)
+    LISTING_SIZE_RE = re.compile(
+        r'href="([^"]+)"[^>]*>[^<]*</a>(?:\s|<[^>]+>)*'
+        r'(?:\d{4}-\d\d-\d\d|\d\d-[A-Za-z]{3}-\d{4}) \d\d:\d\d(?:\s|<[^>]+>)*'
+        r'(\d+(?:\.\d+)?)([KMGT]?)\b'
+    )
     
     def __init__(self, config: Config):
         super().__init__("linux", config)
@@ -236,11 +287,32 @@ class LinuxProvider(OSImageProvider):
         self.session.headers.update({
             'User-Agent': 'BootForge/1.1 (Linux Provider)'
         })
+        # Listing GETs and size HEADs run concurrently; keep enough sockets alive per mirror
+        # host for them, and ride out transient gateway errors
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                              raise_on_status=False)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         
         # Cache for available images
         self._image_cache: List[OSImageInfo] = []
         self._cache_expires = 0
         
+        # Persistent checksum/signature downloads and a private GPG keyring
+        self._verification_dir = config.get_app_dir() / "cache" / "linux_verification"
+        self._gnupg_home = self._verification_dir / "gnupg"
+        self._imported_keys: set = set()
+        # checksum_url -> (fingerprint of the signed files, {filename: checksum}) once GPG-verified
+        self._sumfile_cache: Dict[str, Tuple[tuple, Dict[str, str]]] = {}
+        self._gpg_path: Optional[str] = None  # "" once gpg is known to be missing
+        
+        # Read buffers reused across every file hashed on a thread
+        self._read_buffers = threading.local()
+        
     def get_available_images(self) -> List[OSImageInfo]:
         """Get all available Ubuntu LTS, Kali Linux, Parrot OS, and Arch Linux images"""
         import time
@@ -249,36 +321,26 @@ class LinuxProvider(OSImageProvider):
         if time.time() < self._cache_expires and self._image_cache:
             return self._image_cache.copy()
         
-        images = []
-        
-        # Check each Ubuntu LTS release
-        for version, info in self.UBUNTU_LTS_RELEASES.items():
-            try:
-                release_images = self._get_ubuntu_release_images(version, info)
-                images.extend(release_images)
-            except Exception as e:
-                self.logger.warning(f"Failed to get images for Ubuntu {version}: {e}")
-        
-        # Check Kali Linux releases
-        try:
-            kali_images = self._get_kali_images()
-            images.extend(kali_images)
-        except Exception as e:
-            self.logger.warning(f"Failed to get Kali Linux images: {e}")
-        
-        # Check Parrot OS releases
-        try:
-            parrot_images = self._get_parrot_images()
-            images.extend(parrot_images)
-        except Exception as e:
-            self.logger.warning(f"Failed to get Parrot OS images: {e}")
+        # Every listing is network-bound, so all sources are fetched at once and
+        # merged in the usual order (Ubuntu releases, Kali, Parrot, Arch)
+        sources = [
+            (f"Ubuntu {release.version}", self._get_ubuntu_release_images, (release,))
+            for release in self.UBUNTU_LTS
+        ]
+        sources += [
+            ("Kali Linux", self._get_kali_images, ()),
+            ("Parrot OS", self._get_parrot_images, ()),
+            ("Arch Linux", self._get_arch_images, ()),
+        ]
         
-        # Check Arch Linux releases
-        try:
-            arch_images = self._get_arch_images()
-            images.extend(arch_images)
-        except Exception as e:
-            self.logger.warning(f"Failed to get Arch Linux images: {e}")
+        images = []
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [(label, executor.submit(fetch, *args)) for label, fetch, args in sources]
+            for label, future in futures:
+                try:
+                    images.extend(future.result())
+                except Exception as e:
+                    self.logger.warning(f"Failed to get {label} images: {e}")
         
         # Update cache
         self._image_cache = images
@@ -286,21 +348,27 @@ class LinuxProvider(OSImageProvider):
         
         return images.copy()
     
-    def _get_ubuntu_release_images(self, version: str, release_info: Dict) -> List[OSImageInfo]:
+    def _get_ubuntu_release_images(self, release: _LTSRelease) -> List[OSImageInfo]:
         """Get available images for a specific Ubuntu release"""
         images = []
-        codename = release_info["codename"]
-        release_url = urljoin(self.UBUNTU_BASE_URL, f"{version}/")
+        version = release.version
+        release_url = release.release_url
         
         try:
-            # Get release directory listing
-            response = self.session.get(release_url, timeout=10)
-            response.raise_for_status()
-            
-            # Parse available ISO files
-            iso_pattern = re.compile(rf'href="(ubuntu-{version}.*?\.iso)"')
-            isos = iso_pattern.findall(response.text)
+            # Get release directory listing, scanning it line by line as it streams in
+            isos = []
+            listed_sizes = {}
+            with self.session.get(release_url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines(decode_unicode=True):
+                    listed_sizes.update(self._parse_listing_sizes(line))
+                    for match in self.UBUNTU_ISO_HREF_RE.finditer(line):
+                        # Point releases (e.g. 24.04.3) live in the 24.04 directory
+                        iso_version = match.group(2)
+                        if iso_version == version or iso_version.startswith(version + "."):
+                            isos.append(match.group(1))
             
+            candidates = []
             for iso_filename in isos:
                 # Skip netboot and other specialized images
                 if any(skip in iso_filename for skip in ['netboot', 'mini', 'server']):
@@ -311,16 +379,20 @@ class LinuxProvider(OSImageProvider):
                 if not arch:
                     continue
                 
-                # Get file size from server
-                iso_url = urljoin(release_url, iso_filename)
-                size_bytes = self._get_file_size(iso_url)
-                
+                candidates.append((iso_filename, arch, urljoin(release_url, iso_filename)))
+            
+            # File sizes come from the listing; anything it didn't show is HEADed
+            sizes = self._get_listed_sizes([iso_url for _, _, iso_url in candidates],
+                                           [iso_filename for iso_filename, _, _ in candidates],
+                                           listed_sizes)
+            
+            for (iso_filename, arch, iso_url), size_bytes in zip(candidates, sizes):
                 # Create image info
                 image_id = f"ubuntu-{version}-{arch}"
                 
                 image = OSImageInfo(
                     id=image_id,
-                    name=f"{release_info['name']} ({arch})",
+                    name=f"{release.name} ({arch})",
                     os_family="linux",
                     version=version,
                     architecture=arch,
@@ -332,11 +404,11 @@ class LinuxProvider(OSImageProvider):
                     status=ImageStatus.AVAILABLE,
                     provider=self.name,
                     metadata={
-                        "codename": codename,
-                        "support_until": release_info["support_until"],
+                        "codename": release.codename,
+                        "support_until": release.support_until,
                         "filename": iso_filename,
-                        "checksum_url": urljoin(release_url, "SHA256SUMS"),
-                        "signature_url": urljoin(release_url, "SHA256SUMS.gpg"),
+                        "checksum_url": release.checksum_url,
+                        "signature_url": release.signature_url,
                         "distribution": "ubuntu",
                         "release_type": "lts"
                     }
@@ -351,26 +423,24 @@ class LinuxProvider(OSImageProvider):
     
     def _get_kali_images(self) -> List[OSImageInfo]:
         """Get available Kali Linux images from current and archive releases"""
-        images = []
-        
-        # Get current release images
-        try:
-            current_images = self._get_kali_current_images()
-            images.extend(current_images)
-        except Exception as e:
-            self.logger.warning(f"Failed to get current Kali images: {e}")
+        # Current release first, then archived releases for older versions
+        # (skip 2024.1 since it's likely the current); the listings are fetched
+        # at once and merged in that order
+        sources = [("current Kali", self._get_kali_current_images, ())]
+        sources += [
+            (f"Kali {version}", self._get_kali_archived_images, (version, info))
+            for version, info in self.KALI_RELEASES.items()
+            if version != "2024.1"
+        ]
         
-        # Get archived release images for older versions
-        for version, info in self.KALI_RELEASES.items():
-            # Skip 2024.1 since it's likely the current
-            if version == "2024.1":
-                continue
-                
-            try:
-                archived_images = self._get_kali_archived_images(version, info)
-                images.extend(archived_images)
-            except Exception as e:
-                self.logger.warning(f"Failed to get Kali {version} images: {e}")
+        images = []
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [(label, executor.submit(fetch, *args)) for label, fetch, args in sources]
+            for label, future in futures:
+                try:
+                    images.extend(future.result())
+                except Exception as e:
+                    self.logger.warning(f"Failed to get {label} images: {e}")
         
         return images
     
@@ -394,13 +464,9 @@ class LinuxProvider(OSImageProvider):
                 matches = re.findall(pattern, response.text)
                 isos.extend(matches)
             
-            # Process each ISO
-            for iso_filename in isos:
-                # Parse version from filename instead of hardcoding
-                version = self._parse_kali_version_from_filename(iso_filename) or "2024.1"
-                image_info = self._process_kali_iso(iso_filename, self.KALI_CURRENT_URL, version)
-                if image_info:
-                    images.append(image_info)
+            # Process each ISO (version parsed from the filename instead of hardcoded)
+            images = self._process_kali_isos(isos, self.KALI_CURRENT_URL,
+                                             listed_sizes=self._parse_listing_sizes(response.text))
                     
         except Exception as e:
             self.logger.error(f"Failed to get current Kali images: {e}")
@@ -431,16 +497,35 @@ class LinuxProvider(OSImageProvider):
                 isos.extend(matches)
             
             # Process each ISO
-            for iso_filename in isos:
-                image_info = self._process_kali_iso(iso_filename, archive_url, version)
-                if image_info:
-                    images.append(image_info)
+            images = self._process_kali_isos(isos, archive_url, version,
+                                             self._parse_listing_sizes(response.text))
                     
         except Exception as e:
             self.logger.warning(f"Failed to get archived Kali {version} images: {e}")
         
         return images
     
+    def _process_kali_isos(self, isos: List[str], base_url: str, version: Optional[str] = None,
+                           listed_sizes: Optional[Dict[str, int]] = None) -> List[OSImageInfo]:
+        """Process the ISOs of one Kali listing
+        
+        Sizes come from listed_sizes (see _parse_listing_sizes); the rest are
+        fetched in parallel. Without a version, each ISO's version is parsed
+        from its filename.
+        """
+        # Only ISOs with a known architecture become images; don't size the rest
+        isos = [iso_filename for iso_filename in isos if self._detect_kali_architecture(iso_filename)]
+        sizes = self._get_listed_sizes([urljoin(base_url, iso_filename) for iso_filename in isos],
+                                       isos, listed_sizes or {})
+        
+        images = []
+        for iso_filename, size_bytes in zip(isos, sizes):
+            iso_version = version or self._parse_kali_version_from_filename(iso_filename) or "2024.1"
+            image_info = self._process_kali_iso(iso_filename, base_url, iso_version, size_bytes)
+            if image_info:
+                images.append(image_info)
+        return images
+    
     def _get_parrot_images(self) -> List[OSImageInfo]:
         """Get available Parrot OS images from all releases"""
         images = []
@@ -655,8 +740,9 @@ class LinuxProvider(OSImageProvider):
         # Default to security edition for Parrot (most common)
         return "security", self.PARROT_EDITIONS["security"]
     
-    def _process_kali_iso(self, iso_filename: str, base_url: str, version: str) -> Optional[OSImageInfo]:
-        """Process a Kali ISO filename and create OSImageInfo"""
+    def _process_kali_iso(self, iso_filename: str, base_url: str, version: str,
+                          size_bytes: Optional[int] = None) -> Optional[OSImageInfo]:
+        """Process a Kali ISO filename and create OSImageInfo (size_bytes is fetched if not given)"""
         try:
             # Determine architecture
             arch = self._detect_kali_architecture(iso_filename)
@@ -668,7 +754,8 @@ class LinuxProvider(OSImageProvider):
             
             # Get file size
             iso_url = urljoin(base_url, iso_filename)
-            size_bytes = self._get_file_size(iso_url)
+            if size_bytes is None:
+                size_bytes = self._get_file_size(iso_url)
             
             # Create truly unique image ID using sanitized filename stem
             sanitized_stem = self._sanitize_filename_for_id(iso_filename)
@@ -848,16 +935,20 @@ class LinuxProvider(OSImageProvider):
         
         return "generic"
     
-    def _detect_architecture(self, filename: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _detect_architecture(filename: str) -> Optional[str]:
         """Detect architecture from ISO filename (Ubuntu-focused)"""
-        if "amd64" in filename or "x86_64" in filename:
+        # Set lookups over the name's components, e.g. ubuntu-24.04-desktop-amd64+intel-iot.iso
+        tokens = frozenset(_FILENAME_TOKEN_SPLIT.split(filename.lower()))
+        if not tokens.isdisjoint(_X86_64_TOKENS):
             return "x86_64"
-        elif "arm64" in filename or "aarch64" in filename:
+        elif not tokens.isdisjoint(_ARM64_TOKENS):
             return "arm64"
-        elif "i386" in filename:
+        elif "i386" in tokens:
             return "i386"
         # Desktop images are typically amd64 by default
-        elif "desktop" in filename and not any(arch in filename for arch in ["arm", "i386"]):
+        elif "desktop" in tokens and not any(token.startswith("arm") for token in tokens):
             return "x86_64"
         return None
     
@@ -869,6 +960,30 @@ class LinuxProvider(OSImageProvider):
         except Exception:
             return 0
     
+    def _get_file_sizes(self, urls: List[str]) -> List[int]:
+        """Get file sizes for several URLs, overlapping the HEAD round-trips"""
+        if len(urls) <= 1:
+            return [self._get_file_size(url) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+            return list(executor.map(self._get_file_size, urls))
+    
+    @classmethod
+    def _parse_listing_sizes(cls, html: str) -> Dict[str, int]:
+        """Map filenames to sizes shown in a directory index page (human sizes are 1024-based)"""
+        sizes = {}
+        for filename, number, suffix in cls.LISTING_SIZE_RE.findall(html):
+            scale = 1024 ** ("KMGT".index(suffix) + 1) if suffix else 1
+            sizes[filename] = int(float(number) * scale)
+        return sizes
+    
+    def _get_listed_sizes(self, urls: List[str], filenames: List[str],
+                          listed_sizes: Dict[str, int]) -> List[int]:
+        """Sizes from a parsed listing, HEADing (in parallel) only the files it didn't show"""
+        missing = [url for url, filename in zip(urls, filenames) if filename not in listed_sizes]
+        fetched = dict(zip(missing, self._get_file_sizes(missing)))
+        return [listed_sizes[filename] if filename in listed_sizes else fetched[url]
+                for url, filename in zip(urls, filenames)]
+    
     def search_images(self, query: str, os_family: Optional[str] = None) -> List[OSImageInfo]:
         """Search for Linux images matching query across Ubuntu, Kali, and Parrot distributions"""
         if os_family and os_family != "linux":
@@ -1024,67 +1139,116 @@ class LinuxProvider(OSImageProvider):
                 self.logger.error("Missing verification URLs in image metadata")
                 return False
             
-            # Download checksums and signature
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # Different distributions use different checksum file names
-                if distribution == "parrot":
-                    checksums_path = temp_path / "signed-hashes.txt"
-                    signature_path = temp_path / "signed-hashes.txt.gpg"
-                    checksum_name = "signed-hashes.txt"
-                elif distribution == "arch":
-                    checksums_path = temp_path / "sha256sums.txt"
-                    signature_path = temp_path / "sha256sums.txt.sig"
-                    checksum_name = "sha256sums.txt"
-                else:
-                    checksums_path = temp_path / "SHA256SUMS"
-                    signature_path = temp_path / "SHA256SUMS.gpg"
-                    checksum_name = "SHA256SUMS"
-                
-                # Download checksums file
-                self.logger.info(f"Downloading {checksum_name}...")
-                checksums_response = self.session.get(checksum_url, timeout=30)
-                checksums_response.raise_for_status()
-                checksums_path.write_text(checksums_response.text)
-                
-                # Download GPG signature
-                self.logger.info("Downloading GPG signature...")
-                signature_response = self.session.get(signature_url, timeout=30)
-                signature_response.raise_for_status()
-                signature_path.write_bytes(signature_response.content)
-                
-                # Step 2: Verify GPG signature
+            # Different distributions use different checksum file names
+            if distribution == "parrot":
+                checksum_name = "signed-hashes.txt"
+            elif distribution == "arch":
+                checksum_name = "sha256sums.txt"
+            else:
+                checksum_name = "SHA256SUMS"
+            
+            # Download checksums file (revalidated against the on-disk cache)
+            self.logger.info(f"Fetching {checksum_name}...")
+            checksums_path = self._fetch_cached(checksum_url)
+            
+            # Download GPG signature
+            self.logger.info("Fetching GPG signature...")
+            signature_path = self._fetch_cached(signature_url)
+            
+            # Step 2: Verify GPG signature, unless these exact files were already verified
+            # (both downloads revalidate, and a changed file is replaced with a new inode/mtime)
+            fingerprint = (distribution,) + tuple(
+                (stat.st_ino, stat.st_size, stat.st_mtime_ns) for stat in (checksums_path.stat(), signature_path.stat())
+            )
+            cached = self._sumfile_cache.get(checksum_url)
+            if cached and cached[0] == fingerprint:
+                checksums = cached[1]
+            else:
                 if not self._verify_gpg_signature(checksums_path, signature_path, distribution):
                     self.logger.error("GPG signature verification failed")
                     return False
+                checksums = self._parse_checksums(checksums_path)
+                self._sumfile_cache[checksum_url] = (fingerprint, checksums)
+            
+            # Step 3: Extract expected checksum
+            expected_checksum = checksums.get(filename)
+            if not expected_checksum:
+                self.logger.error(f"Could not find checksum for {filename}")
+                return False
+            
+            try:
+                expected_digest = bytes.fromhex(expected_checksum.strip())
+            except ValueError:
+                self.logger.error(f"Malformed checksum for {filename}: {expected_checksum}")
+                return False
+            
+            # Step 4: Calculate actual checksum
+            actual_digest = self._calculate_sha256_digest(local_path)
+            
+            # Step 5: Compare checksums (raw bytes, constant time, case-insensitive by construction)
+            if hmac.compare_digest(actual_digest, expected_digest):
+                self.logger.info("Image verification successful")
+                return True
+            else:
+                self.logger.error(f"Checksum mismatch: expected {expected_checksum}, got {actual_digest.hex()}")
+                return False
                 
-                # Step 3: Extract expected checksum
-                expected_checksum = self._extract_checksum(checksums_path, filename)
-                if not expected_checksum:
-                    self.logger.error(f"Could not find checksum for {filename}")
-                    return False
-                
-                # Step 4: Calculate actual checksum
-                actual_checksum = self._calculate_sha256(local_path)
-                
-                # Step 5: Compare checksums
-                if actual_checksum.lower() == expected_checksum.lower():
-                    self.logger.info("Image verification successful")
-                    return True
-                else:
-                    self.logger.error(f"Checksum mismatch: expected {expected_checksum}, got {actual_checksum}")
-                    return False
-                    
         except Exception as e:
             self.logger.error(f"Image verification failed: {e}")
             return False
     
+    def _fetch_cached(self, url: str) -> Path:
+        """Download url into the verification cache, revalidating with ETag/Last-Modified"""
+        url_key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        cache_dir = self._verification_dir / url_key
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cached_path = cache_dir / (url.rstrip("/").rsplit("/", 1)[-1] or "index")
+        etag_path = cached_path.with_name(cached_path.name + ".etag")
+        modified_path = cached_path.with_name(cached_path.name + ".last-modified")
+        
+        headers = {}
+        if cached_path.exists():
+            if etag_path.exists():
+                headers["If-None-Match"] = etag_path.read_text().strip()
+            if modified_path.exists():
+                headers["If-Modified-Since"] = modified_path.read_text().strip()
+        
+        response = self.session.get(url, headers=headers, timeout=30)
+        if response.status_code == 304:
+            self.logger.debug(f"Using cached {cached_path.name} for {url}")
+            return cached_path
+        response.raise_for_status()
+        
+        # Write via a temp file so a failed download never leaves a truncated cache entry
+        tmp_path = cached_path.with_name(cached_path.name + ".part")
+        tmp_path.write_bytes(response.content)
+        os.replace(tmp_path, cached_path)
+        for sidecar, header in ((etag_path, "ETag"), (modified_path, "Last-Modified")):
+            value = response.headers.get(header)
+            if value:
+                sidecar.write_text(value)
+            else:
+                sidecar.unlink(missing_ok=True)
+        
+        return cached_path
+    
+    def _gpg_env(self) -> Dict[str, str]:
+        """Environment pointing gpg at BootForge's persistent keyring"""
+        self._gnupg_home.mkdir(parents=True, exist_ok=True)
+        # gpg refuses/complains about a group- or world-readable home
+        os.chmod(self._gnupg_home, 0o700)
+        return {**os.environ, "GNUPGHOME": str(self._gnupg_home)}
+    
     def _verify_gpg_signature(self, checksums_path: Path, signature_path: Path, distribution: str) -> bool:
         """Verify GPG signature of checksums file"""
         try:
-            # Check if GPG is available
-            subprocess.run(["gpg", "--version"], check=True, capture_output=True)
+            # Check if GPG is available (PATH lookup in-process, once per provider)
+            if self._gpg_path is None:
+                self._gpg_path = shutil.which("gpg") or ""
+            if not self._gpg_path:
+                raise FileNotFoundError("gpg not found on PATH")
+            gpg = self._gpg_path
+            gpg_env = self._gpg_env()
             
             # Import the appropriate signing key based on distribution
             if distribution == "kali":
@@ -1100,19 +1264,28 @@ class LinuxProvider(OSImageProvider):
                 signing_key = self.UBUNTU_SIGNING_KEY
                 key_name = "Ubuntu"
             
-            try:
-                subprocess.run([
-                    "gpg", "--keyserver", self.GPG_KEYSERVER,
-                    "--recv-keys", signing_key
-                ], check=True, capture_output=True, timeout=30)
-            except subprocess.CalledProcessError:
-                self.logger.warning(f"Could not import {key_name} signing key from keyserver")
-                # Continue anyway - key might already be imported
+            # The keyring persists, so only hit the keyserver for keys it doesn't hold yet
+            if signing_key not in self._imported_keys:
+                have_key = subprocess.run([
+                    gpg, "--list-keys", signing_key
+                ], capture_output=True, timeout=30, env=gpg_env).returncode == 0
+                if not have_key:
+                    try:
+                        subprocess.run([
+                            gpg, "--keyserver", self.GPG_KEYSERVER,
+                            "--recv-keys", signing_key
+                        ], check=True, capture_output=True, timeout=30, env=gpg_env)
+                        have_key = True
+                    except subprocess.CalledProcessError:
+                        self.logger.warning(f"Could not import {key_name} signing key from keyserver")
+                        # Continue anyway - verification below reports a missing key
+                if have_key:
+                    self._imported_keys.add(signing_key)
             
             # Verify signature
             result = subprocess.run([
-                "gpg", "--verify", str(signature_path), str(checksums_path)
-            ], capture_output=True, timeout=30)
+                gpg, "--verify", str(signature_path), str(checksums_path)
+            ], capture_output=True, timeout=30, env=gpg_env)
             
             if result.returncode == 0:
                 self.logger.info("GPG signature verification successful")
@@ -1135,8 +1308,9 @@ class LinuxProvider(OSImageProvider):
             self.logger.error(f"GPG verification error: {e}")
             return False
     
-    def _extract_checksum(self, checksums_path: Path, filename: str) -> Optional[str]:
-        """Extract SHA256 checksum for specific file from SHA256SUMS"""
+    def _parse_checksums(self, checksums_path: Path) -> Dict[str, str]:
+        """Parse SHA256SUMS into {filename: checksum} (the first entry wins for repeated names)"""
+        checksums = {}
         try:
             content = checksums_path.read_text()
             
@@ -1149,16 +1323,12 @@ class LinuxProvider(OSImageProvider):
                 if len(parts) == 2:
                     checksum, file_path = parts
                     # Handle both *filename and filename formats
-                    clean_filename = file_path.lstrip('*')
-                    
-                    if clean_filename == filename:
-                        return checksum
-            
-            return None
+                    checksums.setdefault(file_path.lstrip('*'), checksum)
             
         except Exception as e:
-            self.logger.error(f"Failed to extract checksum: {e}")
-            return None
+            self.logger.error(f"Failed to parse checksums: {e}")
+        
+        return checksums
     
     def _get_arch_images(self) -> List[OSImageInfo]:
         """Get available Arch Linux images from latest and archived releases"""
@@ -1358,15 +1528,62 @@ class LinuxProvider(OSImageProvider):
         return None
     
     def _calculate_sha256(self, file_path: str) -> str:
-        """Calculate SHA256 checksum of a file"""
-        sha256_hash = hashlib.sha256()
-        
+        """Calculate SHA256 checksum of a file (hex)
+
+        Unused here since verify_image compares raw digests; kept only for
+        interface parity with the other providers' _calculate_sha256.
+        """
+        return self._calculate_sha256_digest(file_path).hex()
+    
+    def _calculate_sha256_digest(self, file_path: str) -> bytes:
+        """Calculate the raw 32-byte SHA256 digest of a file"""
         with open(file_path, "rb") as f:
-            # Read in chunks to handle large files
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256_hash.update(chunk)
-        
-        return sha256_hash.hexdigest()
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return hashlib.sha256().digest()
+            
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Not mappable (e.g. 32-bit address space): stream into a reused buffer instead
+                return self._sha256_readinto(f)
+            
+            # SHA256 is serial, so overlap I/O instead: prefetch the next window
+            # while the current one is hashed (update() drops the GIL on big buffers)
+            sha256_hash = hashlib.sha256()
+            window = self.SHA256_WINDOW
+            with mm:
+                view = memoryview(mm)
+                try:
+                    for offset in range(0, size, window):
+                        next_offset = offset + window
+                        if next_offset < size and hasattr(mm, "madvise"):
+                            mm.madvise(mmap.MADV_WILLNEED, next_offset, min(window, size - next_offset))
+                        sha256_hash.update(view[offset:next_offset])
+                finally:
+                    view.release()
+            
+            return sha256_hash.digest()
+    
+    def _sha256_readinto(self, f) -> bytes:
+        """SHA256 of an open file read through a per-thread 1 MiB buffer (no per-chunk allocations)"""
+        buffer = getattr(self._read_buffers, "buffer", None)
+        if buffer is None:
+            buffer = self._read_buffers.buffer = bytearray(1 << 20)
+        view = memoryview(buffer)
+        sha256_hash = hashlib.sha256()
+        try:
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                sha256_hash.update(view[:n])
+        finally:
+            view.release()
+        return sha256_hash.digest()
     
     def get_supported_families(self) -> List[str]:
         """Get supported OS families"""
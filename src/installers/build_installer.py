@@ -5,17 +5,204 @@ Cross-platform installer creation script
 
 import os
 import sys
+import json
 import platform
 import subprocess
 import shutil
 import traceback
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import importlib.util
 from typing import Optional, List, Tuple
 
 
+# Fixed PyInstaller install locations, built once at import
+_HOME = os.path.expanduser('~')
+_EXE_DIR = os.path.dirname(sys.executable)
+_PYVER = f'{sys.version_info.major}.{sys.version_info.minor}'
+_PYVER_NODOT = f'{sys.version_info.major}{sys.version_info.minor}'
+_PYINSTALLER_SEARCH_PATHS = (
+    # Python scripts directory
+    os.path.join(_EXE_DIR, 'pyinstaller'),
+    os.path.join(_EXE_DIR, 'pyinstaller.exe'),
+    
+    # User site packages (common on Linux/macOS)
+    os.path.join(_HOME, '.local', 'bin', 'pyinstaller'),
+    
+    # macOS user Python installations
+    os.path.join(_HOME, 'Library', 'Python', _PYVER, 'bin', 'pyinstaller'),
+    
+    # Homebrew Python on macOS
+    '/opt/homebrew/bin/pyinstaller',
+    '/usr/local/bin/pyinstaller',
+    
+    # Windows AppData
+    os.path.join(_HOME, 'AppData', 'Roaming', 'Python', f'Python{_PYVER_NODOT}', 'Scripts', 'pyinstaller.exe'),
+    os.path.join(_HOME, 'AppData', 'Local', 'Programs', 'Python', f'Python{_PYVER_NODOT}', 'Scripts', 'pyinstaller.exe'),
+    
+    # Replit workspace
+    '/home/runner/workspace/.pythonlibs/bin/pyinstaller',
+)
+
+
+APP_VERSION = "1.0.0"
+
+# Whether PyQt6 is installed, checked without importing (and initializing) Qt
+_HAS_PYQT6 = importlib.util.find_spec('PyQt6') is not None
+
+# Persistent PyInstaller work directory (not cleaned between builds)
+PYINSTALLER_WORKPATH = os.path.join('build', 'pyi-cache')
+
+# Packaging templates, filled in with str.format (literal braces doubled)
+_ISS_TEMPLATE = """[Setup]
+AppName=BootForge
+AppVersion={version}
+AppPublisher=BootForge Team
+AppPublisherURL=https://bootforge.dev
+DefaultDirName={{pf}}\\BootForge
+DefaultGroupName=BootForge
+UninstallDisplayIcon={{app}}\\{executable_name}
+Compression=lzma2
+SolidCompression=yes
+OutputDir=dist\\windows
+OutputBaseFilename=BootForge-Setup
+WizardStyle=modern
+DisableWelcomePage=no
+PrivilegesRequired=admin
+SetupIconFile=assets\\icons\\app_icon_premium.png
+
+[Files]
+Source: "{executable}"; DestDir: "{{app}}"; Flags: ignoreversion
+Source: "README.md"; DestDir: "{{app}}"; Flags: ignoreversion external skipifnotexists
+Source: "assets\\*"; DestDir: "{{app}}\\assets"; Flags: ignoreversion recursesubdirs external skipifnotexists
+Source: "docs\\*"; DestDir: "{{app}}\\docs"; Flags: ignoreversion recursesubdirs external skipifnotexists
+
+[Icons]
+Name: "{{group}}\\BootForge"; Filename: "{{app}}\\{executable_name}"; WorkingDir: "{{app}}"
+Name: "{{group}}\\Uninstall BootForge"; Filename: "{{uninstallexe}}"
+Name: "{{commondesktop}}\\BootForge"; Filename: "{{app}}\\{executable_name}"; WorkingDir: "{{app}}"; Tasks: desktopicon
+Name: "{{commonstartup}}\\BootForge"; Filename: "{{app}}\\{executable_name}"; WorkingDir: "{{app}}"; Tasks: startupicon
+
+[Tasks]
+Name: desktopicon; Description: "Create a desktop icon"; GroupDescription: "Additional icons:"; Flags: unchecked
+Name: startupicon; Description: "Run BootForge at Windows startup"; GroupDescription: "Additional options:"; Flags: unchecked
+
+[Registry]
+Root: HKCR; Subkey: ".iso"; ValueType: string; ValueName: ""; ValueData: "BootForge.ISOFile"; Flags: uninsdeletevalue; Tasks: associateiso
+Root: HKCR; Subkey: "BootForge.ISOFile"; ValueType: string; ValueName: ""; ValueData: "ISO Disk Image"; Flags: uninsdeletekey; Tasks: associateiso
+Root: HKCR; Subkey: "BootForge.ISOFile\\DefaultIcon"; ValueType: string; ValueName: ""; ValueData: "{{app}}\\{executable_name},0"; Tasks: associateiso
+Root: HKCR; Subkey: "BootForge.ISOFile\\shell\\open\\command"; ValueType: string; ValueName: ""; ValueData: "\\"{{app}}\\{executable_name}\\" \\"%1\\""; Tasks: associateiso
+
+[Tasks]
+Name: associateiso; Description: "Associate BootForge with ISO files"; GroupDescription: "File associations:"; Flags: unchecked
+
+[Run]
+Filename: "{{app}}\\{executable_name}"; Description: "Launch BootForge"; Flags: nowait postinstall skipifsilent
+"""
+
+_PLIST_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>CFBundleExecutable</key>
+    <string>BootForge</string>
+    <key>CFBundleIdentifier</key>
+    <string>dev.bootforge.BootForge</string>
+    <key>CFBundleName</key>
+    <string>BootForge</string>
+    <key>CFBundleVersion</key>
+    <string>{version}</string>
+    <key>CFBundleShortVersionString</key>
+    <string>{version}</string>
+    <key>CFBundlePackageType</key>
+    <string>APPL</string>
+    <key>LSMinimumSystemVersion</key>
+    <string>10.15</string>
+    <key>CFBundleIconFile</key>
+    <string>AppIcon.icns</string>
+    <key>NSHighResolutionCapable</key>
+    <true/>
+    <key>LSApplicationCategoryType</key>
+    <string>public.app-category.utilities</string>
+    <key>NSRequiresAquaSystemAppearance</key>
+    <false/>
+</dict>
+</plist>"""
+
+_DESKTOP_TEMPLATE = """[Desktop Entry]
+Version=1.0
+Type=Application
+Name=BootForge
+Comment=Professional OS Deployment Tool for Mac, Windows, and Linux
+GenericName=OS Deployment Tool
+Exec=BootForge
+Icon=bootforge
+StartupNotify=true
+Categories=System;Utility;Settings;
+Keywords=bootable;usb;installer;deployment;macos;windows;linux;
+MimeType=application/x-iso9660-image;application/x-cd-image;application/x-raw-disk-image;
+X-AppImage-Version={version}
+"""
+
+# Version-only templates, rendered and encoded once
+_PLIST_BYTES = _PLIST_TEMPLATE.format(version=APP_VERSION).encode('utf-8')
+_DESKTOP_BYTES = _DESKTOP_TEMPLATE.format(version=APP_VERSION).encode('utf-8')
+
+_APPRUN_TEMPLATE = """#!/bin/bash
+# BootForge AppImage Launcher with Qt Support
+set -e
+
+HERE="$(dirname "$(readlink -f "${{0}}")")"
+export APPDIR="$HERE"
+
+# Set up library paths
+if [ -d "$HERE/lib" ]; then
+    export LD_LIBRARY_PATH="$HERE/lib:${{LD_LIBRARY_PATH}}"
+fi
+
+if [ -d "$HERE/usr/lib" ]; then
+    export LD_LIBRARY_PATH="$HERE/usr/lib:${{LD_LIBRARY_PATH}}"
+fi
+
+# Set up Qt plugin paths  
+if [ -d "$HERE/usr/plugins" ]; then
+    export QT_PLUGIN_PATH="$HERE/usr/plugins:${{QT_PLUGIN_PATH}}"
+fi
+
+if [ -d "$HERE/plugins" ]; then
+    export QT_PLUGIN_PATH="$HERE/plugins:${{QT_PLUGIN_PATH}}"
+fi
+
+# Disable Qt's xcb plugin warnings in AppImage environment
+export QT_LOGGING_RULES="qt.qpa.xcb.warning=false"
+
+# Change to app directory
+cd "$HERE"
+
+# Check if executable exists
+if [ ! -f "./{executable_name}" ]; then
+    echo "Error: {executable_name} executable not found"
+    exit 1
+fi
+
+# Make sure it's executable
+chmod +x "./{executable_name}"
+
+# Launch with all arguments
+exec "./{executable_name}" "$@"
+"""
+
+
+@functools.lru_cache(maxsize=None)
 def find_pyinstaller() -> Optional[str]:
-    """Find PyInstaller executable with robust path detection"""
+    """Find PyInstaller executable with robust path detection
+    
+    The result is cached for the life of the process; call
+    ``find_pyinstaller.cache_clear()`` to force a fresh search.
+    """
     
     # Try using Python module approach first (more reliable in restricted environments)
     try:
@@ -25,43 +212,39 @@ def find_pyinstaller() -> Optional[str]:
     except ImportError:
         pass
     
-    # Common installation locations to check
-    search_paths = [
-        # Current PATH
-        shutil.which('pyinstaller'),
-        
-        # Python scripts directory
-        str(Path(sys.executable).parent / 'pyinstaller'),
-        str(Path(sys.executable).parent / 'pyinstaller.exe'),
-        
-        # User site packages (common on Linux/macOS)
-        str(Path.home() / '.local' / 'bin' / 'pyinstaller'),
-        
-        # macOS user Python installations
-        str(Path.home() / 'Library' / 'Python' / f'{sys.version_info.major}.{sys.version_info.minor}' / 'bin' / 'pyinstaller'),
-        
-        # Homebrew Python on macOS
-        '/opt/homebrew/bin/pyinstaller',
-        '/usr/local/bin/pyinstaller',
-        
-        # Windows AppData
-        str(Path.home() / 'AppData' / 'Roaming' / 'Python' / f'Python{sys.version_info.major}{sys.version_info.minor}' / 'Scripts' / 'pyinstaller.exe'),
-        str(Path.home() / 'AppData' / 'Local' / 'Programs' / 'Python' / f'Python{sys.version_info.major}{sys.version_info.minor}' / 'Scripts' / 'pyinstaller.exe'),
-        
-        # Current workspace (Replit-specific)
-        str(Path.cwd() / '.pythonlibs' / 'bin' / 'pyinstaller'),
-        '/home/runner/workspace/.pythonlibs/bin/pyinstaller',
-    ]
+    # Current PATH, the fixed locations, then the current workspace
+    search_paths = (
+        (shutil.which('pyinstaller'),)
+        + _PYINSTALLER_SEARCH_PATHS
+        + (os.path.join(os.getcwd(), '.pythonlibs', 'bin', 'pyinstaller'),)
+    )
     
-    # Check each location
+    # Check each location, listing every parent directory only once
+    listings = {}
     for path in search_paths:
-        if path and Path(path).exists() and os.access(path, os.X_OK):
+        if not path:
+            continue
+        parent, name = os.path.split(path)
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as it:
+                    listings[parent] = {entry.name: entry for entry in it}
+            except OSError:
+                listings[parent] = {}
+        entry = listings[parent].get(name)
+        if entry is not None and entry.is_file() and os.access(path, os.X_OK):
             print(f"✅ Found PyInstaller binary at: {path}")
             return path
     
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _which_cached(tool: str) -> Optional[str]:
+    """Resolve an external tool on PATH once, remembering misses too"""
+    return shutil.which(tool)
+
+
 def check_dependencies() -> Tuple[bool, List[str]]:
     """Check if all required dependencies are available"""
     missing_deps = []
@@ -72,10 +255,9 @@ def check_dependencies() -> Tuple[bool, List[str]]:
         warnings.append('PyInstaller not found - will use fallback method')
     
     # Check PyQt6 for GUI builds (this IS critical for GUI functionality)
-    try:
-        import PyQt6
+    if _HAS_PYQT6:
         print("✅ PyQt6 available - GUI features enabled")
-    except ImportError:
+    else:
         print("⚠️  PyQt6 not available - GUI features will be limited")
         warnings.append('PyQt6 missing - GUI may not work properly')
     
@@ -103,6 +285,128 @@ def get_platform_spec_file() -> Optional[str]:
     return None
 
 
+def _write_bytes(path, data: bytes, mode: int = 0o644) -> None:
+    """Write data in one os.write, creating the file with its final permission bits"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), mode)
+    try:
+        if mode & 0o111 and hasattr(os, 'fchmod'):
+            # The creation mode is filtered by the umask; scripts must stay executable
+            os.fchmod(fd, mode)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _fast_copy(src, dst) -> None:
+    """Copy a file in-kernel where possible, preserving metadata like copy2"""
+    if not hasattr(os, 'copy_file_range'):
+        # Non-Linux: copy2 already uses the platform's in-kernel copy (fcopyfile)
+        shutil.copy2(src, dst)
+        return
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            # Filesystem or kernel without copy_file_range support
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    shutil.copystat(src, dst)
+
+
+def _copy_parallel(jobs: List[Tuple[str, str]]) -> None:
+    """Run file copy jobs on a thread pool (the copies release the GIL)"""
+    if not jobs:
+        return
+    workers = min(32, (os.cpu_count() or 1) * 4, len(jobs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(_fast_copy, src, dst) for src, dst in jobs]:
+            future.result()
+
+
+_COPY_MANIFEST = '.copy-manifest.json'
+
+
+def _scan_tree(top) -> dict:
+    """Map every file under top (by relative path) to [size, mtime_ns]"""
+    state = {}
+    stack = ['']
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            with os.scandir(os.path.join(top, rel_dir)) as it:
+                for entry in it:
+                    rel = os.path.join(rel_dir, entry.name)
+                    if entry.is_dir():
+                        stack.append(rel)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        state[rel] = [st.st_size, st.st_mtime_ns]
+        except FileNotFoundError:
+            pass
+    return state
+
+
+def _sync_tree(src, dst) -> int:
+    """Mirror src into dst, copying only files whose size or mtime changed
+    
+    Files that no longer exist in src are removed. The synced state is
+    recorded in a manifest inside dst so the next sync can skip walking
+    dst. Returns the number of files copied.
+    """
+    src_state = _scan_tree(src)
+    manifest = os.path.join(dst, _COPY_MANIFEST)
+    try:
+        with open(manifest, 'r', encoding='utf-8') as f:
+            dst_state = json.load(f)
+    except (OSError, ValueError):
+        dst_state = _scan_tree(dst)
+        dst_state.pop(_COPY_MANIFEST, None)
+    
+    changed = [rel for rel, meta in src_state.items() if dst_state.get(rel) != meta]
+    removed = [rel for rel in dst_state if rel not in src_state]
+    if changed or removed or not os.path.exists(manifest):
+        # Invalidate the manifest until the tree matches it again
+        try:
+            os.unlink(manifest)
+        except FileNotFoundError:
+            pass
+        
+        for rel in removed:
+            try:
+                os.unlink(os.path.join(dst, rel))
+            except FileNotFoundError:
+                pass
+        # Drop directories emptied by the removals, deepest first
+        for rel_dir in sorted({os.path.dirname(rel) for rel in removed}, key=len, reverse=True):
+            while rel_dir:
+                try:
+                    os.rmdir(os.path.join(dst, rel_dir))
+                except OSError:
+                    break
+                rel_dir = os.path.dirname(rel_dir)
+        
+        for rel_dir in {os.path.dirname(rel) for rel in changed}:
+            os.makedirs(os.path.join(dst, rel_dir), exist_ok=True)
+        os.makedirs(dst, exist_ok=True)
+        _copy_parallel([(os.path.join(src, rel), os.path.join(dst, rel)) for rel in changed])
+        
+        staged = f"{manifest}.{os.getpid()}"
+        with open(staged, 'w', encoding='utf-8') as f:
+            json.dump(src_state, f)
+        os.replace(staged, manifest)
+    return len(changed)
+
+
 def create_standalone_script() -> bool:
     """Create a standalone script as fallback when PyInstaller doesn't work"""
     print("🔄 Creating standalone script (PyInstaller fallback)...")
@@ -141,22 +445,20 @@ if __name__ == "__main__":
 '''
         
         # Write standalone script
-        standalone_file = Path('dist/bootforge-standalone.py')
-        standalone_file.write_text(standalone_content)
-        standalone_file.chmod(0o755)
+        _write_bytes('dist/bootforge-standalone.py', standalone_content.encode('utf-8'), 0o755)
         
-        # Copy source files to dist
-        src_dist = Path('dist/src')
-        if src_dist.exists():
-            shutil.rmtree(src_dist)
-        shutil.copytree('src', src_dist)
+        # Sync source files to dist, recopying only what changed
+        copied = _sync_tree('src', 'dist/src')
+        print(f"📁 Synced src/ to dist/src ({copied} files updated)")
         
         # Copy main.py
-        shutil.copy2('main.py', 'dist/main.py')
+        jobs = [('main.py', 'dist/main.py')]
         
         # Copy requirements
         if Path('requirements.txt').exists():
-            shutil.copy2('requirements.txt', 'dist/requirements.txt')
+            jobs.append(('requirements.txt', 'dist/requirements.txt'))
+        
+        _copy_parallel(jobs)
         
         print("✅ Standalone script created successfully")
         print("📝 Usage: python3 dist/bootforge-standalone.py")
@@ -167,6 +469,41 @@ if __name__ == "__main__":
         return False
 
 
+def _run_streaming(cmd: List[str], timeout: float) -> Tuple[int, bool]:
+    """Run a build command, echoing its output as it arrives
+    
+    Returns the exit code and whether a ptrace restriction was detected.
+    A ptrace/ESRCH message only counts as a restriction when the build
+    then fails; PyInstaller can print such warnings and still succeed.
+    Raises subprocess.TimeoutExpired if the timeout elapses first.
+    """
+    deadline = time.monotonic() + timeout
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        cwd=Path.cwd()
+    ) as proc:
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        saw_ptrace = False
+        try:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                if not saw_ptrace:
+                    lowered = line.lower()
+                    saw_ptrace = "ptrace" in lowered or "esrch" in lowered
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+    
+    if returncode != 0 and time.monotonic() >= deadline:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return returncode, saw_ptrace and returncode != 0
+
+
 def build_executable() -> bool:
     """Build standalone executable with PyInstaller"""
     print("🔨 Building BootForge executable...")
@@ -211,8 +548,7 @@ def build_executable() -> bool:
         ])
         
         # Add GUI support if available
-        try:
-            import PyQt6
+        if _HAS_PYQT6:
             cmd.extend([
                 '--hidden-import=PyQt6.QtWidgets',
                 '--hidden-import=PyQt6.QtCore', 
@@ -220,45 +556,49 @@ def build_executable() -> bool:
                 '--hidden-import=src.gui'
             ])
             print("🖥️  Including GUI support (PyQt6 detected)")
-        except ImportError:
+        else:
             print("📟 Building CLI-only version (PyQt6 not available)")
     
+    # Keep PyInstaller's work directory between runs so rebuilds reuse its
+    # analysis and dependency caches instead of rescanning from scratch
+    cmd.extend([
+        '--workpath', os.path.abspath(PYINSTALLER_WORKPATH),
+        '--distpath', os.path.abspath('dist'),
+        '--noconfirm',
+    ])
+    
     print(f"🚀 Running: {' '.join(cmd)}")
     
     try:
-        # Create dist directory
+        # Create dist and persistent work directories
         Path('dist').mkdir(exist_ok=True)
+        os.makedirs(PYINSTALLER_WORKPATH, exist_ok=True)
         
         # Run PyInstaller with environment restrictions check
-        result = subprocess.run(
-            cmd, 
-            capture_output=True, 
-            text=True,
-            cwd=Path.cwd(),
-            timeout=300  # 5 minute timeout
-        )
+        returncode, restricted = _run_streaming(cmd, timeout=300)  # 5 minute timeout
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Executable built successfully")
             
             # Show build artifacts
-            dist_dir = Path('dist')
-            if dist_dir.exists():
-                artifacts = list(dist_dir.glob('*'))
-                if artifacts:
-                    print("\n📦 Build artifacts:")
-                    for artifact in artifacts:
-                        size = artifact.stat().st_size if artifact.is_file() else 0
-                        size_mb = size / (1024 * 1024) if size > 0 else 0
-                        print(f"   • {artifact.name} ({size_mb:.1f}MB)")
+            try:
+                with os.scandir('dist') as it:
+                    artifacts = list(it)
+            except OSError:
+                artifacts = []
+            if artifacts:
+                print("\n📦 Build artifacts:")
+                for artifact in artifacts:
+                    size = artifact.stat().st_size if artifact.is_file(follow_symlinks=False) else 0
+                    size_mb = size / (1024 * 1024) if size > 0 else 0
+                    print(f"   • {artifact.name} ({size_mb:.1f}MB)")
             
             return True
         else:
             print("❌ PyInstaller build failed!")
             
             # Check for specific environment issues
-            error_output = result.stderr.lower() if result.stderr else ""
-            if "ptrace" in error_output or "esrch" in error_output:
+            if restricted:
                 print("\n⚠️  Environment Limitation Detected:")
                 print("   This appears to be a restricted environment that doesn't support")
                 print("   PyInstaller's process monitoring features (ptrace restrictions).")
@@ -266,11 +606,7 @@ def build_executable() -> bool:
                 return create_standalone_script()
             else:
                 print(f"\n🔍 Error details:")
-                print(f"Exit code: {result.returncode}")
-                if result.stdout:
-                    print(f"STDOUT: {result.stdout}")
-                if result.stderr:
-                    print(f"STDERR: {result.stderr}")
+                print(f"Exit code: {returncode}")
                 
                 print("\n🔄 Trying fallback method...")
                 return create_standalone_script()
@@ -437,59 +773,26 @@ def create_windows_installer():
     sign_windows_executable(executable)
     
     # Try Inno Setup installer first
-    iss_content = f"""[Setup]
-AppName=BootForge
-AppVersion=1.0.0
-AppPublisher=BootForge Team
-AppPublisherURL=https://bootforge.dev
-DefaultDirName={{pf}}\\BootForge
-DefaultGroupName=BootForge
-UninstallDisplayIcon={{app}}\\{executable.name}
-Compression=lzma2
-SolidCompression=yes
-OutputDir=dist\\windows
-OutputBaseFilename=BootForge-Setup
-WizardStyle=modern
-DisableWelcomePage=no
-PrivilegesRequired=admin
-SetupIconFile=assets\\icons\\app_icon_premium.png
-
-[Files]
-Source: "{executable}"; DestDir: "{{app}}"; Flags: ignoreversion
-Source: "README.md"; DestDir: "{{app}}"; Flags: ignoreversion external skipifnotexists
-Source: "assets\\*"; DestDir: "{{app}}\\assets"; Flags: ignoreversion recursesubdirs external skipifnotexists
-Source: "docs\\*"; DestDir: "{{app}}\\docs"; Flags: ignoreversion recursesubdirs external skipifnotexists
-
-[Icons]
-Name: "{{group}}\\BootForge"; Filename: "{{app}}\\{executable.name}"; WorkingDir: "{{app}}"
-Name: "{{group}}\\Uninstall BootForge"; Filename: "{{uninstallexe}}"
-Name: "{{commondesktop}}\\BootForge"; Filename: "{{app}}\\{executable.name}"; WorkingDir: "{{app}}"; Tasks: desktopicon
-Name: "{{commonstartup}}\\BootForge"; Filename: "{{app}}\\{executable.name}"; WorkingDir: "{{app}}"; Tasks: startupicon
-
-[Tasks]
-Name: desktopicon; Description: "Create a desktop icon"; GroupDescription: "Additional icons:"; Flags: unchecked
-Name: startupicon; Description: "Run BootForge at Windows startup"; GroupDescription: "Additional options:"; Flags: unchecked
-
-[Registry]
-Root: HKCR; Subkey: ".iso"; ValueType: string; ValueName: ""; ValueData: "BootForge.ISOFile"; Flags: uninsdeletevalue; Tasks: associateiso
-Root: HKCR; Subkey: "BootForge.ISOFile"; ValueType: string; ValueName: ""; ValueData: "ISO Disk Image"; Flags: uninsdeletekey; Tasks: associateiso
-Root: HKCR; Subkey: "BootForge.ISOFile\\DefaultIcon"; ValueType: string; ValueName: ""; ValueData: "{{app}}\\{executable.name},0"; Tasks: associateiso
-Root: HKCR; Subkey: "BootForge.ISOFile\\shell\\open\\command"; ValueType: string; ValueName: ""; ValueData: "\\"{{app}}\\{executable.name}\\" \\"%1\\""; Tasks: associateiso
-
-[Tasks]
-Name: associateiso; Description: "Associate BootForge with ISO files"; GroupDescription: "File associations:"; Flags: unchecked
-
-[Run]
-Filename: "{{app}}\\{executable.name}"; Description: "Launch BootForge"; Flags: nowait postinstall skipifsilent
-"""
+    iss_content = _ISS_TEMPLATE.format(
+        version=APP_VERSION, executable=executable, executable_name=executable.name
+    )
     
     # Write Inno Setup script
-    iss_file = Path("BootForge.iss")
-    iss_file.write_text(iss_content)
+    _write_bytes("BootForge.iss", iss_content.encode('utf-8'))
     
-    # Run Inno Setup compiler
-    try:
-        result = subprocess.run(['iscc', 'BootForge.iss'], capture_output=True, text=True)
+    # The portable ZIP is built either way (alternative or fallback), so
+    # package it while the Inno Setup compiler runs
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        zip_package = pool.submit(create_windows_zip_package)
+        
+        # Run Inno Setup compiler
+        iscc = _which_cached('iscc')
+        if iscc is None:
+            print("⚠️  Inno Setup not found - using ZIP fallback")
+            print("   Install Inno Setup from: https://jrsoftware.org/isdl.php")
+            return zip_package.result()
+        
+        result = subprocess.run([iscc, 'BootForge.iss'], capture_output=True, text=True)
         if result.returncode == 0:
             print("✅ Windows installer created")
             
@@ -498,17 +801,13 @@ Filename: "{{app}}\\{executable.name}"; Description: "Launch BootForge"; Flags:
             if installer_path.exists():
                 sign_windows_executable(installer_path)
             
-            # Also create ZIP package as alternative
-            create_windows_zip_package()
+            # ZIP package is available as an alternative
+            zip_package.result()
             return True
         else:
             print(f"❌ Installer creation failed: {result.stderr}")
-            print("🔄 Creating ZIP package fallback...")
-            return create_windows_zip_package()
-    except FileNotFoundError:
-        print("⚠️  Inno Setup not found - creating ZIP fallback")
-        print("   Install Inno Setup from: https://jrsoftware.org/isdl.php")
-        return create_windows_zip_package()
+            print("🔄 Using ZIP package fallback...")
+            return zip_package.result()
 
 
 def find_macos_executable() -> Optional[Path]:
@@ -747,46 +1046,15 @@ def create_macos_installer():
         print(f"✅ Copied existing .app bundle to {app_dir}")
     else:
         # Create app bundle structure from bare executable
-        app_dir.mkdir(parents=True, exist_ok=True)
-        (app_dir / "Contents").mkdir(exist_ok=True)
-        (app_dir / "Contents/MacOS").mkdir(exist_ok=True)
-        (app_dir / "Contents/Resources").mkdir(exist_ok=True)
+        os.makedirs(app_dir / "Contents/MacOS", exist_ok=True)
+        os.makedirs(app_dir / "Contents/Resources", exist_ok=True)
         
         # Copy executable
-        shutil.copy2(macos_executable, app_dir / "Contents/MacOS/BootForge")
+        _fast_copy(macos_executable, app_dir / "Contents/MacOS/BootForge")
         (app_dir / "Contents/MacOS/BootForge").chmod(0o755)
         
         # Create Info.plist
-        plist_content = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>CFBundleExecutable</key>
-    <string>BootForge</string>
-    <key>CFBundleIdentifier</key>
-    <string>dev.bootforge.BootForge</string>
-    <key>CFBundleName</key>
-    <string>BootForge</string>
-    <key>CFBundleVersion</key>
-    <string>1.0.0</string>
-    <key>CFBundleShortVersionString</key>
-    <string>1.0.0</string>
-    <key>CFBundlePackageType</key>
-    <string>APPL</string>
-    <key>LSMinimumSystemVersion</key>
-    <string>10.15</string>
-    <key>CFBundleIconFile</key>
-    <string>AppIcon.icns</string>
-    <key>NSHighResolutionCapable</key>
-    <true/>
-    <key>LSApplicationCategoryType</key>
-    <string>public.app-category.utilities</string>
-    <key>NSRequiresAquaSystemAppearance</key>
-    <false/>
-</dict>
-</plist>"""
-        
-        (app_dir / "Contents/Info.plist").write_text(plist_content)
+        _write_bytes(app_dir / "Contents/Info.plist", _PLIST_BYTES)
         
         # Find and convert icon
         icon_paths = [
@@ -818,34 +1086,51 @@ def create_macos_installer():
         notarize_macos_app(app_dir)
     
     # Create DMG
-    try:
-        dmg_path = Path("dist/BootForge-1.0.0.dmg")
-        result = subprocess.run([
-            'hdiutil', 'create', '-volname', 'BootForge',
-            '-srcfolder', str(app_dir.parent),
-            '-ov', '-format', 'UDZO',
-            str(dmg_path)
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print("✅ macOS DMG created")
-            
-            # Sign the DMG if we have signing credentials
-            if signed:
-                sign_windows_executable(dmg_path)  # Reuse Windows signing function for DMG
-            
-            return True
-        else:
-            print(f"❌ DMG creation failed: {result.stderr}")
-            return False
-    except FileNotFoundError:
+    hdiutil = _which_cached('hdiutil')
+    if hdiutil is None:
         print("❌ hdiutil not found - macOS required for DMG creation")
         return False
+    
+    dmg_path = Path("dist/BootForge-1.0.0.dmg")
+    result = subprocess.run([
+        hdiutil, 'create', '-volname', 'BootForge',
+        '-srcfolder', str(app_dir.parent),
+        '-ov', '-format', 'UDZO',
+        str(dmg_path)
+    ], capture_output=True, text=True)
+    
+    if result.returncode == 0:
+        print("✅ macOS DMG created")
+        
+        # Sign the DMG if we have signing credentials
+        if signed:
+            sign_windows_executable(dmg_path)  # Reuse Windows signing function for DMG
+        
+        return True
+    else:
+        print(f"❌ DMG creation failed: {result.stderr}")
+        return False
 
 
-def find_linux_executable() -> Optional[Path]:
-    """Find the Linux executable"""
-    dist_dir = Path("dist")
+def list_dist_files(dist_dir: str = "dist") -> List[str]:
+    """Names of the regular files directly inside dist_dir, from one scandir"""
+    try:
+        with os.scandir(dist_dir) as it:
+            return [entry.name for entry in it if entry.is_file()]
+    except OSError:
+        return []
+
+
+def find_linux_executable(dist_files: Optional[List[str]] = None) -> Optional[Path]:
+    """Find the Linux executable
+    
+    ``dist_files`` may be a listing from list_dist_files() to reuse;
+    otherwise dist/ is listed here.
+    """
+    if dist_files is None:
+        dist_files = list_dist_files()
+    present = set(dist_files)
+    
     executable_candidates = [
         "BootForge-Linux-x64",
         "BootForge", 
@@ -854,8 +1139,8 @@ def find_linux_executable() -> Optional[Path]:
     ]
     
     for candidate in executable_candidates:
-        candidate_path = dist_dir / candidate
-        if candidate_path.exists() and candidate_path.is_file():
+        if candidate in present:
+            candidate_path = Path("dist") / candidate
             print(f"✅ Found Linux executable: {candidate_path}")
             return candidate_path
     
@@ -926,46 +1211,51 @@ Support: https://bootforge.dev
     print(f"✅ Linux tarball created: {tar_path}")
     return True
 
+@functools.lru_cache(maxsize=None)
+def _qt_deploy_env(qt_version: str) -> dict:
+    """Environment for linuxdeploy-qt, built once per Qt version
+    
+    Every other tool inherits the parent environment directly (env=None),
+    which needs no per-call copy.
+    """
+    env = os.environ.copy()
+    env['QMAKE'] = _which_cached('qmake') or f'qmake-qt{qt_version}'
+    return env
+
+
 def deploy_qt_dependencies(appdir: Path, executable_path: Path) -> bool:
     """Deploy Qt dependencies for AppImage using linuxdeploy-qt"""
-    try:
-        # Check if PyQt6 is being used
-        import PyQt6
+    # Check which PyQt is installed (without importing it)
+    if _HAS_PYQT6:
         qt_version = "6"
-        print(f"🔍 Detected PyQt{qt_version}")
-    except ImportError:
-        try:
-            import PyQt5
-            qt_version = "5"
-            print(f"🔍 Detected PyQt{qt_version}")
-        except ImportError:
-            print("⚠️  No Qt libraries detected - skipping Qt deployment")
-            return True
+    elif importlib.util.find_spec('PyQt5') is not None:
+        qt_version = "5"
+    else:
+        print("⚠️  No Qt libraries detected - skipping Qt deployment")
+        return True
+    print(f"🔍 Detected PyQt{qt_version}")
     
     # Try linuxdeploy-qt first
-    try:
+    linuxdeploy_qt = _which_cached('linuxdeploy-qt')
+    if linuxdeploy_qt is None:
+        print("⚠️  linuxdeploy-qt not found")
+    else:
         print("📦 Deploying Qt dependencies with linuxdeploy-qt...")
         
-        env = os.environ.copy()
-        env['QMAKE'] = shutil.which('qmake') or f'qmake-qt{qt_version}'
-        
         cmd = [
-            'linuxdeploy-qt', 
+            linuxdeploy_qt, 
             '--executable', str(executable_path),
             '--appdir', str(appdir),
             '--output', 'appimage'
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+        result = subprocess.run(cmd, capture_output=True, text=True, env=_qt_deploy_env(qt_version))
         
         if result.returncode == 0:
             print("✅ Qt dependencies deployed successfully")
             return True
         else:
             print(f"⚠️  linuxdeploy-qt failed: {result.stderr}")
-            
-    except FileNotFoundError:
-        print("⚠️  linuxdeploy-qt not found")
     
     # Fallback: try to manually copy Qt libraries
     print("🔄 Attempting manual Qt library deployment...")
@@ -1019,53 +1309,9 @@ def deploy_qt_dependencies(appdir: Path, executable_path: Path) -> bool:
 
 def create_enhanced_apprun(appdir: Path, executable_name: str) -> None:
     """Create enhanced AppRun script with better library handling"""
-    apprun_content = f"""#!/bin/bash
-# BootForge AppImage Launcher with Qt Support
-set -e
-
-HERE="$(dirname "$(readlink -f "${{0}}")")"
-export APPDIR="$HERE"
-
-# Set up library paths
-if [ -d "$HERE/lib" ]; then
-    export LD_LIBRARY_PATH="$HERE/lib:${{LD_LIBRARY_PATH}}"
-fi
-
-if [ -d "$HERE/usr/lib" ]; then
-    export LD_LIBRARY_PATH="$HERE/usr/lib:${{LD_LIBRARY_PATH}}"
-fi
-
-# Set up Qt plugin paths  
-if [ -d "$HERE/usr/plugins" ]; then
-    export QT_PLUGIN_PATH="$HERE/usr/plugins:${{QT_PLUGIN_PATH}}"
-fi
-
-if [ -d "$HERE/plugins" ]; then
-    export QT_PLUGIN_PATH="$HERE/plugins:${{QT_PLUGIN_PATH}}"
-fi
-
-# Disable Qt's xcb plugin warnings in AppImage environment
-export QT_LOGGING_RULES="qt.qpa.xcb.warning=false"
-
-# Change to app directory
-cd "$HERE"
-
-# Check if executable exists
-if [ ! -f "./{executable_name}" ]; then
-    echo "Error: {executable_name} executable not found"
-    exit 1
-fi
-
-# Make sure it's executable
-chmod +x "./{executable_name}"
-
-# Launch with all arguments
-exec "./{executable_name}" "$@"
-"""
+    apprun_content = _APPRUN_TEMPLATE.format(executable_name=executable_name)
     
-    apprun_file = appdir / "AppRun"
-    apprun_file.write_text(apprun_content)
-    apprun_file.chmod(0o755)
+    _write_bytes(appdir / "AppRun", apprun_content.encode('utf-8'), 0o755)
     print("✅ Created enhanced AppRun script with Qt support")
 
 
@@ -1074,18 +1320,37 @@ def create_linux_package():
     print("Creating Linux package...")
     
     # Find the executable in dist directory
-    executable_path = find_linux_executable()
+    dist_files = list_dist_files()
+    executable_path = find_linux_executable(dist_files)
     if not executable_path:
         print("❌ Could not find Linux executable in dist directory")
         print("Available files:")
-        dist_dir = Path("dist")
-        for item in dist_dir.iterdir():
-            if item.is_file():
-                print(f"   • {item.name}")
+        for name in dist_files:
+            print(f"   • {name}")
         return False
     
     print(f"✅ Found executable: {executable_path}")
     
+    # The portable tarball is built either way, so package it while the
+    # AppImage is assembled
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        tarball = pool.submit(create_linux_tarball)
+        appimage_created = build_appimage(executable_path)
+        tarball_created = tarball.result()
+    
+    if appimage_created:
+        # Tarball is available as an alternative
+        return True
+    else:
+        print("🔄 AppImage tools not available - using tarball fallback")
+        print("   Install AppImage tools for better Linux packaging:")
+        print("   • appimagetool: https://github.com/AppImage/AppImageKit")
+        print("   • linuxdeploy: https://github.com/linuxdeploy/linuxdeploy")
+        return tarball_created
+
+
+def build_appimage(executable_path: Path) -> bool:
+    """Assemble an AppDir around the executable and build an AppImage from it"""
     # Create AppDir structure
     appdir = Path("dist/linux/BootForge.AppDir")
     if appdir.exists():
@@ -1093,7 +1358,7 @@ def create_linux_package():
     appdir.mkdir(parents=True, exist_ok=True)
     
     # Copy executable
-    shutil.copy2(executable_path, appdir / "BootForge")
+    _fast_copy(executable_path, appdir / "BootForge")
     (appdir / "BootForge").chmod(0o755)
     
     # Deploy Qt dependencies if needed
@@ -1115,22 +1380,7 @@ def create_linux_package():
             break
     
     # Create enhanced desktop file
-    desktop_content = """[Desktop Entry]
-Version=1.0
-Type=Application
-Name=BootForge
-Comment=Professional OS Deployment Tool for Mac, Windows, and Linux
-GenericName=OS Deployment Tool
-Exec=BootForge
-Icon=bootforge
-StartupNotify=true
-Categories=System;Utility;Settings;
-Keywords=bootable;usb;installer;deployment;macos;windows;linux;
-MimeType=application/x-iso9660-image;application/x-cd-image;application/x-raw-disk-image;
-X-AppImage-Version=1.0.0
-"""
-    
-    (appdir / "BootForge.desktop").write_text(desktop_content)
+    _write_bytes(appdir / "BootForge.desktop", _DESKTOP_BYTES)
     
     # Create enhanced AppRun script
     create_enhanced_apprun(appdir, "BootForge")
@@ -1172,16 +1422,19 @@ X-AppImage-Version=1.0.0
     # Create usr/share/metainfo directory
     metainfo_dir = appdir / "usr/share/metainfo"
     metainfo_dir.mkdir(parents=True, exist_ok=True)
-    (metainfo_dir / "dev.bootforge.BootForge.appdata.xml").write_text(appdata_content)
+    _write_bytes(metainfo_dir / "dev.bootforge.BootForge.appdata.xml", appdata_content.encode('utf-8'))
     
     # Try appimagetool first, then linuxdeploy, then fallback
     appimage_created = False
     
     # Method 1: Try appimagetool
-    try:
+    appimagetool = _which_cached('appimagetool')
+    if appimagetool is None:
+        print("⚠️  appimagetool not found")
+    else:
         print("🔨 Building AppImage with appimagetool...")
         result = subprocess.run([
-            'appimagetool', '--no-appstream',
+            appimagetool, '--no-appstream',
             str(appdir), 'dist/linux/BootForge-1.0.0-x86_64.AppImage'
         ], capture_output=True, text=True)
         
@@ -1190,16 +1443,16 @@ X-AppImage-Version=1.0.0
             appimage_created = True
         else:
             print(f"⚠️  appimagetool failed: {result.stderr}")
-            
-    except FileNotFoundError:
-        print("⚠️  appimagetool not found")
     
     # Method 2: Try linuxdeploy if appimagetool failed
     if not appimage_created:
-        try:
+        linuxdeploy = _which_cached('linuxdeploy')
+        if linuxdeploy is None:
+            print("⚠️  linuxdeploy not found")
+        else:
             print("🔨 Building AppImage with linuxdeploy...")
             result = subprocess.run([
-                'linuxdeploy', '--appdir', str(appdir),
+                linuxdeploy, '--appdir', str(appdir),
                 '--output', 'appimage',
                 '--desktop-file', str(appdir / "BootForge.desktop")
             ], capture_output=True, text=True)
@@ -1209,20 +1462,8 @@ X-AppImage-Version=1.0.0
                 appimage_created = True
             else:
                 print(f"⚠️  linuxdeploy failed: {result.stderr}")
-                
-        except FileNotFoundError:
-            print("⚠️  linuxdeploy not found")
     
-    if appimage_created:
-        # Also create tarball as alternative
-        create_linux_tarball()
-        return True
-    else:
-        print("🔄 AppImage tools not available - creating tarball fallback")
-        print("   Install AppImage tools for better Linux packaging:")
-        print("   • appimagetool: https://github.com/AppImage/AppImageKit")
-        print("   • linuxdeploy: https://github.com/linuxdeploy/linuxdeploy")
-        return create_linux_tarball()
+    return appimage_created
 
 
 def main() -> bool:
@@ -1286,16 +1527,22 @@ def main() -> bool:
         print("✅ Build completed successfully!")
         print(f"📁 Installers available in: {dist_dir.absolute()}")
         
-        # List all build artifacts
-        artifacts = list(dist_dir.rglob('*'))
-        if artifacts:
-            print("\n📦 Available artifacts:")
-            for artifact in sorted(artifacts):
-                if artifact.is_file():
-                    size = artifact.stat().st_size
-                    size_mb = size / (1024 * 1024)
-                    rel_path = artifact.relative_to(dist_dir)
-                    print(f"   • {rel_path} ({size_mb:.1f}MB)")
+        # List all build artifacts, streamed directory by directory
+        header_printed = False
+        for root, dirs, files in os.walk(dist_dir):
+            dirs.sort()
+            files.sort()
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    size = os.stat(path).st_size
+                except OSError:
+                    continue
+                if not header_printed:
+                    print("\n📦 Available artifacts:")
+                    header_printed = True
+                size_mb = size / (1024 * 1024)
+                print(f"   • {os.path.relpath(path, dist_dir)} ({size_mb:.1f}MB)")
         
         print("\n🎉 Ready for distribution!")
         return True
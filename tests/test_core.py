@@ -3,6 +3,7 @@ BootForge Core Tests
 Test suite for core functionality
 """
 
+import hashlib
 import pytest
 import tempfile
 import os
@@ -13,7 +14,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from src.core.config import Config, AppConfig
-from src.core.disk_manager import DiskManager, DiskInfo
+from src.core.disk_manager import DiskManager, DiskInfo, DiskWriter
 from src.plugins.plugin_manager import PluginManager
 
 
@@ -78,6 +79,62 @@ class TestDiskManager:
             assert hasattr(drive, 'name')
             assert hasattr(drive, 'size_bytes')
     
+    def test_describe_device_from_sysfs_scan(self):
+        """Partition paths resolve to their disk's entry in a /sys/block scan"""
+        disk_manager = DiskManager()
+        block_devices = {"sdb": {"removable": "1", "model": "Cruzer", "vendor": "SanDisk", "serial": "42"}}
+        
+        assert disk_manager._describe_device("/dev/sdb1", block_devices) == (True, "Cruzer", "SanDisk", "42")
+        assert disk_manager._describe_device("/dev/sdc1", block_devices) == (False, None, None, None)
+    
+    def test_windows_scan_skips_network_and_optical_drives(self, monkeypatch):
+        """Only removable and fixed drive letters are opened for their storage descriptor"""
+        import ctypes
+        from src.core import disk_manager as dm
+        
+        drive_types = {"C:\\": 3, "D:\\": 4, "E:\\": 2, "F:\\": 5}  # fixed, remote, removable, cdrom
+        kernel32 = type("Kernel32", (), {
+            "GetLogicalDrives": staticmethod(lambda: 0b111100),
+            "GetDriveTypeW": staticmethod(drive_types.__getitem__),
+        })
+        monkeypatch.setattr(ctypes, "windll", type("WinDLL", (), {"kernel32": kernel32}), raising=False)
+        queried = []
+        monkeypatch.setattr(dm, "_storage_descriptor", lambda device: queried.append(device) or ("V", "M", "S"))
+        
+        devices = DiskManager()._scan_windows_volumes()
+        
+        assert queried == ["\\\\.\\C:", "\\\\.\\E:"]
+        assert devices == {
+            "C:\\": {"removable": "0", "model": "M", "vendor": "V", "serial": "S"},
+            "E:\\": {"removable": "1", "model": "M", "vendor": "V", "serial": "S"},
+        }
+    
+    def test_udev_scan_uses_unescaped_names(self, monkeypatch):
+        """Without a hwdb entry, names come from the decoded ID_*_ENC values, not the underscored ID_*"""
+        from src.core import disk_manager as dm
+        
+        device = type("Device", (), {"sys_name": "sdb", "sys_path": "/sys/block/sdb", "properties": {
+            "ID_MODEL": "Cruzer_Blade", "ID_MODEL_ENC": r"Cruzer\x20Blade\x20\x20\x20",
+            "ID_VENDOR": "SanDisk", "ID_VENDOR_ENC": r"SanDisk\x20",
+            "ID_SERIAL_SHORT": "4C530001",
+        }})
+        context = type("Context", (), {"list_devices": lambda self, **match: [device]})
+        monkeypatch.setattr(dm, "pyudev", type("pyudev", (), {"Context": context}))
+        monkeypatch.setattr(dm, "_read_sysfs", lambda path: "1" if path.endswith("removable") else None)
+        
+        assert DiskManager()._scan_udev_block() == {
+            "sdb": {"removable": "1", "model": "Cruzer Blade", "vendor": "SanDisk", "serial": "4C530001"},
+        }
+    
+    def test_device_name(self):
+        """Partition paths map to the whole-disk /sys/block name"""
+        from src.core.disk_manager import _device_name
+        assert _device_name("/dev/sdb1") == "sdb"
+        assert _device_name("/dev/sdb") == "sdb"
+        assert _device_name("/dev/nvme0n1p3") == "nvme0n1"
+        assert _device_name("/dev/nvme0n1") == "nvme0n1"
+        assert _device_name("/dev/mmcblk0p1") == "mmcblk0"
+    
     def test_disk_info_structure(self):
         """Test DiskInfo data structure"""
         disk_info = DiskInfo(
@@ -99,6 +156,97 @@ class TestDiskManager:
         assert disk_info.is_removable is True
 
 
+class TestDiskWriter:
+    """Test image writing and verification (regular files stand in for the device)"""
+
+    def _write(self, temp_dir, image):
+        writer = DiskWriter()
+        writer.buffer_size = 4096
+        writer.source_path = str(Path(temp_dir) / "image.iso")
+        writer.target_device = str(Path(temp_dir) / "device.img")
+        Path(writer.source_path).write_bytes(image)
+        assert writer._write_image_data(len(image))
+        return writer
+
+    def test_write_error_fails_without_hanging(self):
+        """A target that can't be opened fails the write instead of blocking the reader"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = DiskWriter()
+            writer.buffer_size = 4096
+            writer.source_path = str(Path(temp_dir) / "image.iso")
+            writer.target_device = temp_dir
+            Path(writer.source_path).write_bytes(os.urandom(4096 * 20))
+            assert not writer._write_image_data(4096 * 20)
+
+    def test_verify_ignores_trailing_device_data(self):
+        """Only the image-sized prefix of the device is compared"""
+        image = os.urandom(4096 * 5 + 100)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = self._write(temp_dir, image)
+            with open(writer.target_device, "ab") as device:
+                device.write(b"\0" * 8192)
+            assert writer._verify_written_data(len(image))
+
+    def test_verify_detects_mismatch(self):
+        """A single corrupted byte on the device fails verification"""
+        image = os.urandom(4096 * 5 + 100)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = self._write(temp_dir, image)
+            with open(writer.target_device, "r+b") as device:
+                device.seek(4096 * 3)
+                device.write(bytes([image[4096 * 3] ^ 0xFF]))
+            assert not writer._verify_written_data(len(image))
+
+    def test_write_records_source_digest(self):
+        """The write pass leaves the source SHA-256 behind for verification"""
+        image = os.urandom(4096 * 5 + 100)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = self._write(temp_dir, image)
+            assert writer._source_hash.digest() == hashlib.sha256(image).digest()
+            assert Path(writer.target_device).read_bytes() == image
+
+    def test_write_without_verify(self):
+        """An unverified write copies the image byte for byte"""
+        image = os.urandom(4096 * 5 + 100)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = DiskWriter()
+            writer.buffer_size = 4096
+            writer.verify_after_write = False
+            writer.source_path = str(Path(temp_dir) / "image.iso")
+            writer.target_device = str(Path(temp_dir) / "device.img")
+            Path(writer.source_path).write_bytes(image)
+            assert writer._write_image_data(len(image))
+            assert Path(writer.target_device).read_bytes() == image
+
+    def _verify_unwritten(self, temp_dir, source, device, verify_mode):
+        writer = DiskWriter()
+        writer.buffer_size = 4096
+        writer.verify_mode = verify_mode
+        writer.source_path = str(Path(temp_dir) / "image.iso")
+        writer.target_device = str(Path(temp_dir) / "device.img")
+        Path(writer.source_path).write_bytes(source)
+        Path(writer.target_device).write_bytes(device)
+        return writer._verify_written_data(len(device))
+
+    @pytest.mark.parametrize("verify_mode", ["compare", "sha256"])
+    def test_verify_without_write_pass(self, verify_mode):
+        """Without a recorded checksum the image-sized source prefix is compared or hashed on demand"""
+        image = os.urandom(4096 * 5 + 100)
+        corrupt = image[:4096 * 4] + bytes([image[4096 * 4] ^ 0xFF]) + image[4096 * 4 + 1:]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert self._verify_unwritten(temp_dir, image + b"trailing", image, verify_mode)
+            assert not self._verify_unwritten(temp_dir, image, corrupt, verify_mode)
+
+    def test_verify_sha256_without_file_digest(self, monkeypatch):
+        """Interpreters without hashlib.file_digest (Python 3.10) hash the source with a readinto loop"""
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        image = os.urandom(4096 * 5 + 100)
+        corrupt = image[:4096 * 4] + bytes([image[4096 * 4] ^ 0xFF]) + image[4096 * 4 + 1:]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert self._verify_unwritten(temp_dir, image + b"trailing", image, "sha256")
+            assert not self._verify_unwritten(temp_dir, image, corrupt, "sha256")
+
+
 class TestPluginManager:
     """Test plugin management functionality"""
     
@@ -0,0 +1,239 @@
+"""
+BootForge Linux Provider Tests
+Offline tests for checksum calculation and verification-file caching
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+from pathlib import Path
+
+from src.core.config import Config
+from src.core.providers.linux_provider import LinuxProvider
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Records request headers and replays queued responses"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, dict(headers or {})))
+        return self.responses.pop(0)
+
+
+def make_provider(temp_dir):
+    provider = LinuxProvider(Config(str(Path(temp_dir) / "config.json")))
+    provider._verification_dir = Path(temp_dir) / "linux_verification"
+    return provider
+
+
+class TestChecksum:
+    """Test SHA256 calculation"""
+
+    def test_sha256_matches_hashlib(self):
+        """Windowed hashing matches a one-shot hash, including a partial last window"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            provider = make_provider(temp_dir)
+            provider.SHA256_WINDOW = mmap.ALLOCATIONGRANULARITY
+            data = os.urandom(mmap.ALLOCATIONGRANULARITY * 3 + 123)
+            image = Path(temp_dir) / "image.iso"
+            image.write_bytes(data)
+
+            assert provider._calculate_sha256_digest(str(image)) == hashlib.sha256(data).digest()
+
+    def test_sha256_empty_file(self):
+        """Empty files can't be mapped but still hash"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            provider = make_provider(temp_dir)
+            image = Path(temp_dir) / "empty.iso"
+            image.write_bytes(b"")
+
+            assert provider._calculate_sha256_digest(str(image)) == hashlib.sha256().digest()
+
+
+class TestVerificationCache:
+    """Test conditional re-download of checksum files"""
+
+    def test_fetch_cached_revalidates_with_etag(self):
+        """A 304 reuses the cached file and the ETag is sent back"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            provider = make_provider(temp_dir)
+            url = "https://example.invalid/24.04/SHA256SUMS"
+            provider.session = FakeSession([
+                FakeResponse(200, b"abc *ubuntu.iso\n", {"ETag": '"v1"'}),
+                FakeResponse(304),
+            ])
+
+            first = provider._fetch_cached(url)
+            second = provider._fetch_cached(url)
+
+            assert first == second
+            assert second.read_bytes() == b"abc *ubuntu.iso\n"
+            assert provider.session.requests[0][1] == {}
+            assert provider.session.requests[1][1]["If-None-Match"] == '"v1"'
+
+    def test_fetch_cached_replaces_changed_file(self):
+        """A fresh 200 overwrites the cached copy"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            provider = make_provider(temp_dir)
+            url = "https://example.invalid/24.04/SHA256SUMS"
+            provider.session = FakeSession([
+                FakeResponse(200, b"old\n", {"ETag": '"v1"'}),
+                FakeResponse(200, b"new\n", {"ETag": '"v2"'}),
+            ])
+
+            provider._fetch_cached(url)
+            path = provider._fetch_cached(url)
+
+            assert path.read_bytes() == b"new\n"
+            assert path.with_name(path.name + ".etag").read_text() == '"v2"'
+
+
+class TestVerifyImage:
+    """Test the checksum comparison in verify_image"""
+
+    def _verify(self, temp_dir, sums_line):
+        provider = make_provider(temp_dir)
+        image = Path(temp_dir) / "ubuntu.iso"
+        image.write_bytes(b"iso payload")
+        sums = Path(temp_dir) / "SHA256SUMS"
+        sums.write_text(sums_line)
+        provider._fetch_cached = lambda url: sums
+        provider._verify_gpg_signature = lambda *args: True
+        image_info = type("Image", (), {"metadata": {
+            "distribution": "ubuntu",
+            "checksum_url": "https://example.invalid/SHA256SUMS",
+            "signature_url": "https://example.invalid/SHA256SUMS.gpg",
+            "filename": "ubuntu.iso",
+        }})()
+        return provider.verify_image(image_info, str(image))
+
+    def test_matching_checksum_any_case(self):
+        """Upper-case hex in SHA256SUMS still matches"""
+        digest = hashlib.sha256(b"iso payload").hexdigest().upper()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert self._verify(temp_dir, f"{digest} *ubuntu.iso\n")
+
+    def test_mismatched_or_malformed_checksum(self):
+        """Wrong or non-hex checksums fail verification"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert not self._verify(temp_dir, f"{'0' * 64} *ubuntu.iso\n")
+            assert not self._verify(temp_dir, "not-a-hash *ubuntu.iso\n")
+
+    def test_signature_checked_once_per_sums_file(self):
+        """Re-verifying against unchanged sums files reuses the verified parse"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            provider = make_provider(temp_dir)
+            image = Path(temp_dir) / "ubuntu.iso"
+            image.write_bytes(b"iso payload")
+            sums = Path(temp_dir) / "SHA256SUMS"
+            sums.write_text(f"{hashlib.sha256(b'iso payload').hexdigest()} *ubuntu.iso\n")
+            provider._fetch_cached = lambda url: sums
+            gpg_calls = []
+            provider._verify_gpg_signature = lambda *args: gpg_calls.append(args) or True
+            image_info = type("Image", (), {"metadata": {
+                "distribution": "ubuntu",
+                "checksum_url": "https://example.invalid/SHA256SUMS",
+                "signature_url": "https://example.invalid/SHA256SUMS.gpg",
+                "filename": "ubuntu.iso",
+            }})()
+
+            assert provider.verify_image(image_info, str(image))
+            assert provider.verify_image(image_info, str(image))
+            assert len(gpg_calls) == 1
+
+            # A re-downloaded sums file is verified again
+            sums.write_text(f"{'0' * 64} *ubuntu.iso\n")
+            assert not provider.verify_image(image_info, str(image))
+            assert len(gpg_calls) == 2
+
+
+class TestArchitectureDetection:
+    """Test Ubuntu ISO architecture detection"""
+
+    def test_detect_architecture(self):
+        """Architecture comes from whole filename components"""
+        detect = LinuxProvider._detect_architecture
+        assert detect("ubuntu-24.04.3-desktop-amd64.iso") == "x86_64"
+        assert detect("ubuntu-22.04-desktop-amd64+intel-iot.iso") == "x86_64"
+        assert detect("ubuntu-24.04-desktop-arm64.iso") == "arm64"
+        assert detect("ubuntu-18.04.6-desktop-i386.iso") == "i386"
+        assert detect("ubuntu-24.04-desktop.iso") == "x86_64"
+        assert detect("ubuntu-24.04-desktop-armhf.iso") is None
+        assert detect("ubuntu-24.04-live-server-s390x.iso") is None
+
+
+class TestKaliListing:
+    """Test Kali listing fan-out"""
+
+    def test_sizes_fetched_once_per_listing(self):
+        """Sizes come from one batched lookup and only for ISOs with a known architecture"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            provider = make_provider(temp_dir)
+            batches = []
+            provider._get_file_sizes = lambda urls: batches.append(urls) or [len(url) for url in urls]
+            isos = ["kali-linux-2023.4-installer-amd64.iso", "kali-linux-2023.4-live-i686.iso"]
+
+            images = provider._process_kali_isos(isos, "https://example.invalid/kali-2023.4/", "2023.4")
+
+            assert batches == [["https://example.invalid/kali-2023.4/kali-linux-2023.4-installer-amd64.iso"]]
+            assert [image.size_bytes for image in images] == [len(batches[0][0])]
+            assert images[0].version == "2023.4"
+
+    def test_archives_merged_in_release_order(self):
+        """Current images come first, then archives in KALI_RELEASES order"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            provider = make_provider(temp_dir)
+            provider._get_kali_current_images = lambda: ["current"]
+            provider._get_kali_archived_images = lambda version, info: [version]
+
+            archived = [version for version in LinuxProvider.KALI_RELEASES if version != "2024.1"]
+            assert provider._get_kali_images() == ["current"] + archived
+
+
+class TestListingSizes:
+    """Test file sizes parsed from directory index pages"""
+
+    def test_parse_apache_and_nginx_rows(self):
+        """Human sizes are 1024-based; plain byte counts are taken as-is"""
+        html = (
+            '<tr><td><a href="ubuntu-24.04.3-desktop-amd64.iso">ubuntu-24.04.3-desktop-amd64.iso</a></td>'
+            '<td align="right">2025-08-05 17:54  </td><td align="right">5.9G</td><td>Desktop image</td></tr>\n'
+            '<a href="kali-linux-2024.1-installer-amd64.iso">kali-linux-2024.1-installer-amd64.iso</a>'
+            '      27-Feb-2024 09:25   4084203520\n'
+            '<a href="ubuntu-24.04.3-desktop-amd64.iso.torrent">BitTorrent</a> (Desktop)\n'
+        )
+        assert LinuxProvider._parse_listing_sizes(html) == {
+            "ubuntu-24.04.3-desktop-amd64.iso": int(5.9 * 1024 ** 3),
+            "kali-linux-2024.1-installer-amd64.iso": 4084203520,
+        }
+
+    def test_only_unlisted_files_are_fetched(self):
+        """Files missing from the listing fall back to a size lookup"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            provider = make_provider(temp_dir)
+            fetched = []
+            provider._get_file_sizes = lambda urls: fetched.extend(urls) or [7] * len(urls)
+
+            sizes = provider._get_listed_sizes(["https://example.invalid/a.iso", "https://example.invalid/b.iso"],
+                                               ["a.iso", "b.iso"], {"a.iso": 42})
+
+            assert sizes == [42, 7]
+            assert fetched == ["https://example.invalid/b.iso"]
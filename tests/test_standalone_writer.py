@@ -0,0 +1,195 @@
+"""
+BootForge Standalone Writer Tests
+Image writers in archive/old_builds/bootforge-standalone.py, against regular files
+"""
+
+import errno
+import importlib.util
+import io
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("click")
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "archive" / "old_builds" / "bootforge-standalone.py"
+_spec = importlib.util.spec_from_file_location("bootforge_standalone", _SCRIPT)
+standalone = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(standalone)
+
+
+class FakeUring:
+    """Synchronous stand-in for the liburing binding: each SQE is a pwrite, run on submit"""
+
+    class Cqe:
+        def __init__(self, res, user_data):
+            self.res = res
+            self.user_data = user_data
+
+    def __init__(self, short_write_at=None, init_errno=None):
+        self.short_write_at = short_write_at  # offset whose write completes one sector short
+        self.init_errno = init_errno  # errno raised by io_uring_queue_init, e.g. a disabled ring
+        self.pending = []
+        self.completed = []
+
+    def io_uring(self):
+        return object()
+
+    def io_uring_cqes(self):
+        return [None]
+
+    def io_uring_queue_init(self, depth, ring, flags):
+        if self.init_errno is not None:
+            raise OSError(self.init_errno, os.strerror(self.init_errno))
+
+    def io_uring_queue_exit(self, ring):
+        pass
+
+    def io_uring_get_sqe(self, ring):
+        sqe = {}
+        self.pending.append(sqe)
+        return sqe
+
+    def io_uring_prep_write(self, sqe, fd, buf, n, offset):
+        sqe.update(fd=fd, data=bytes(buf[:n]), offset=offset)
+
+    def io_uring_sqe_set_data64(self, sqe, data):
+        sqe["user_data"] = data
+
+    def io_uring_submit(self, ring):
+        for sqe in self.pending:
+            data = sqe["data"]
+            if sqe["offset"] == self.short_write_at:
+                data = data[:-standalone.UringWriter.ALIGN]
+            res = os.pwrite(sqe["fd"], data, sqe["offset"])
+            self.completed.append(self.Cqe(res, sqe["user_data"]))
+        self.pending = []
+
+    def io_uring_wait_cqe(self, ring, cqes):
+        cqes[0] = self.completed.pop(0)
+
+    def io_uring_cqe_seen(self, ring, cqe):
+        pass
+
+
+class ShortReader(io.RawIOBase):
+    """Raw reader that returns at most ``step`` bytes per readinto"""
+
+    def __init__(self, data, step):
+        self._data = io.BytesIO(data)
+        self._step = step
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self._data.read(min(len(buffer), self._step))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def _uring_writer(monkeypatch, fake, chunk_size=8192, max_batch=2):
+    monkeypatch.setattr(standalone, "liburing", fake, raising=False)
+    # tmpfs rejects O_DIRECT; alignment is still exercised by the padding logic
+    monkeypatch.delattr(os, "O_DIRECT", raising=False)
+    return standalone.UringWriter(chunk_size=chunk_size, max_batch=max_batch, queue_depth=8)
+
+
+class TestUringWriter:
+    """Test the batched io_uring writer"""
+
+    def test_write_matches_image(self, monkeypatch):
+        """Several batches plus an unaligned tail land byte for byte; padding isn't counted"""
+        image = os.urandom(8192 * 5 + 100)
+        writer = _uring_writer(monkeypatch, FakeUring())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "image.iso"
+            device = Path(temp_dir) / "device.img"
+            source.write_bytes(image)
+            device.write_bytes(b"")
+            try:
+                assert writer.write(source, str(device)) == len(image)
+            finally:
+                writer.close()
+            written = device.read_bytes()
+            assert written[:len(image)] == image
+            assert written[len(image):] == bytes(len(written) - len(image))
+
+    def test_short_reads_fill_whole_chunks(self, monkeypatch):
+        """Short reads mid-file are retried, so only the EOF chunk is padded"""
+        image = os.urandom(8192 * 2 + 100)
+        writer = _uring_writer(monkeypatch, FakeUring(), max_batch=4)
+        try:
+            lengths, data_bytes = writer._fill(ShortReader(image, 3000), writer.buffer_sets[0])
+        finally:
+            writer.close()
+        assert lengths == [8192, 8192, 4096]
+        assert data_bytes == len(image)
+
+    def test_short_write_fails(self, monkeypatch):
+        """A completion shorter than its chunk is an error, not silent corruption"""
+        writer = _uring_writer(monkeypatch, FakeUring(short_write_at=8192))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "image.iso"
+            device = Path(temp_dir) / "device.img"
+            source.write_bytes(os.urandom(8192 * 3))
+            device.write_bytes(b"")
+            try:
+                with pytest.raises(OSError, match="short write"):
+                    writer.write(source, str(device))
+            finally:
+                writer.close()
+
+
+class TestSyncWriter:
+    """Test the synchronous fallback writer"""
+
+    def test_write_matches_image(self):
+        """The fallback copies the image exactly and reports its size"""
+        image = os.urandom(4096 * 3 + 7)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "image.iso"
+            device = Path(temp_dir) / "device.img"
+            source.write_bytes(image)
+            device.write_bytes(b"")
+            assert standalone.write_image_sync(source, str(device), chunk_size=4096) == len(image)
+            assert device.read_bytes() == image
+
+
+class TestWriteImageToDevice:
+    """Test backend selection and the fallback to the synchronous writer"""
+
+    def _write(self, monkeypatch, fake):
+        monkeypatch.setattr(standalone, "liburing", fake)
+        monkeypatch.setattr(standalone, "_HAS_URING", True)
+        image = os.urandom(4096 * 3 + 7)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "image.iso"
+            device = Path(temp_dir) / "device.img"
+            source.write_bytes(image)
+            device.write_bytes(b"")
+            assert standalone.write_image_to_device(source, str(device)) == len(image)
+            assert device.read_bytes() == image
+
+    def test_ring_setup_failure_falls_back(self, monkeypatch):
+        """A kernel that refuses io_uring (EPERM with io_uring_disabled) still gets the image"""
+        monkeypatch.delattr(os, "O_DIRECT", raising=False)
+        self._write(monkeypatch, FakeUring(init_errno=errno.EPERM))
+
+    def test_o_direct_rejection_falls_back(self, monkeypatch):
+        """A device that rejects O_DIRECT with EINVAL is written synchronously instead"""
+        fake_direct = 0x40000000
+        real_open = os.open
+
+        def open_without_direct(path, flags, *args, **kwargs):
+            if flags & fake_direct:
+                raise OSError(errno.EINVAL, os.strerror(errno.EINVAL))
+            return real_open(path, flags, *args, **kwargs)
+
+        monkeypatch.setattr(os, "O_DIRECT", fake_direct, raising=False)
+        monkeypatch.setattr(os, "open", open_without_direct)
+        fake = FakeUring()
+        self._write(monkeypatch, fake)
+        assert fake.completed == []
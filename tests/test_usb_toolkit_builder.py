@@ -0,0 +1,116 @@
+"""
+BootForge USB Toolkit Builder Tests
+Offline tests for the ZIP distribution
+"""
+
+import os
+import tempfile
+import zipfile
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+from build_system import usb_toolkit_builder
+from build_system.usb_toolkit_builder import USBToolkitBuilder
+
+
+def make_builder(temp_dir):
+    builder = USBToolkitBuilder()
+    builder.dist_dir = Path(temp_dir) / "dist"
+    builder.usb_dir = Path(temp_dir) / "usb_toolkit"
+    builder.dist_dir.mkdir()
+    files = {
+        "README.txt": b"BootForge USB toolkit\n" * 4096,
+        "tools/rebuild_usb.py": b"print('rebuild')\n",
+        "executables/BootForge": os.urandom((1 << 20) + 123),
+        "os_images/Linux/logo.png": os.urandom(5000),
+    }
+    for name, data in files.items():
+        path = builder.usb_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return builder
+
+
+def assert_zip_matches(zip_path, usb_dir):
+    expected = {
+        path.relative_to(usb_dir).as_posix(): path.read_bytes()
+        for path in usb_dir.rglob("*") if path.is_file()
+    }
+    with zipfile.ZipFile(zip_path) as zipf:
+        assert zipf.testzip() is None
+        assert {name: zipf.read(name) for name in zipf.namelist()} == expected
+
+
+class TestZipDistribution:
+    """Test building and incrementally rebuilding the toolkit ZIP"""
+
+    def test_zip_round_trips_across_rebuilds(self, capsys):
+        """A rebuild reuses unchanged entries and still yields a valid, identical archive"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            builder = make_builder(temp_dir)
+            zip_path = builder.create_zip_distribution()
+            assert_zip_matches(zip_path, builder.usb_dir)
+            with zipfile.ZipFile(zip_path) as zipf:
+                assert zipf.getinfo("README.txt").compress_type == zipfile.ZIP_DEFLATED
+                assert zipf.getinfo("os_images/Linux/logo.png").compress_type == zipfile.ZIP_STORED
+
+            # Second build copies unchanged entries from the first ZIP and recompresses the rest
+            (builder.usb_dir / "tools" / "rebuild_usb.py").write_bytes(b"print('rebuilt')\n" * 100)
+            (builder.usb_dir / "tools" / "new_tool.sh").write_bytes(b"#!/bin/sh\n")
+            zip_path = builder.create_zip_distribution()
+            assert_zip_matches(zip_path, builder.usb_dir)
+            assert "(3/5 entries reused)" in capsys.readouterr().out
+            assert not zip_path.with_name(zip_path.name + ".tmp").exists()
+
+    def test_large_files_are_streamed(self, monkeypatch):
+        """Files over the stream threshold are written through ZipFile.open and reused later"""
+        monkeypatch.setattr(usb_toolkit_builder, "_STREAM_THRESHOLD", 1 << 20)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            builder = make_builder(temp_dir)
+            (builder.usb_dir / "tools" / "notes.txt").write_bytes(b"streamed text\n" * 200000)
+            zip_path = builder.create_zip_distribution()
+            assert_zip_matches(zip_path, builder.usb_dir)
+            with zipfile.ZipFile(zip_path) as zipf:
+                assert zipf.getinfo("tools/notes.txt").compress_type == zipfile.ZIP_DEFLATED
+                assert zipf.getinfo("executables/BootForge").compress_type == zipfile.ZIP_STORED
+
+            zip_path = builder.create_zip_distribution()
+            assert_zip_matches(zip_path, builder.usb_dir)
+
+    def test_failed_build_removes_temp_zip(self, monkeypatch):
+        """An error while writing leaves nothing behind in dist/"""
+        def broken(path):
+            raise OSError("read error")
+
+        monkeypatch.setattr(usb_toolkit_builder, "_compress_file", broken)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            builder = make_builder(temp_dir)
+            with pytest.raises(OSError, match="read error"):
+                builder.create_zip_distribution()
+            assert list(builder.dist_dir.iterdir()) == []
+
+
+class TestCompressionWindow:
+    """Test the bounded submit-ahead used for compression"""
+
+    def test_window_is_bounded_by_bytes(self):
+        """Work is only submitted while the pending input fits the byte budget"""
+        submitted = []
+
+        class RecordingPool:
+            def submit(self, fn, arg):
+                submitted.append(arg)
+                future = Future()
+                future.set_result(fn(arg))
+                return future
+
+        items = [(name, 40) for name in "abcdef"]
+        results = usb_toolkit_builder._map_ahead(RecordingPool(), str.upper, items, max_bytes=100)
+        assert next(results) == "A"
+        # a and b fit the 100-byte budget; c waits until a has been consumed
+        assert submitted == ["a", "b"]
+        assert next(results) == "B"
+        assert submitted == ["a", "b", "c"]
+        assert list(results) == ["C", "D", "E", "F"]